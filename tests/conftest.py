@@ -0,0 +1,39 @@
+import pytest
+
+from tism.crconnect import base
+
+
+class FakeResponse:
+    def __init__(self, status_code=200, content=b'{}', headers=None):
+        self.status_code = status_code
+        self.content = content
+        self.headers = headers or {}
+        self.closed = False
+
+    def close(self):
+        self.closed = True
+
+
+class FakeSession:
+    '''A session that records each request and replies with the queued responses.'''
+
+    def __init__(self, *responses, api_key='key'):
+        self.headers = { 'X-API-KEY': api_key }
+        self.responses = list(responses)
+        self.requests = []
+
+    def request(self, **kwargs):
+        self.requests.append(kwargs)
+        response = self.responses.pop(0)
+
+        if isinstance(response, Exception):
+            raise response
+
+        return response
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    base.invalidate_cache()
+    yield
+    base.invalidate_cache()
@@ -0,0 +1,65 @@
+import json
+
+import pytest
+
+from tism.crconnect import assignments
+
+from conftest import FakeResponse, FakeSession
+
+
+def _sent(session, key):
+    # The (idempotency token, participant ids) of each request, in the order the chunks were built.
+    sent = [(r.get('headers', {}).get('IDEMPOTENCY-TOKEN'), [p['id'] for p in json.loads(r['data'])[key]])
+            for r in session.requests]
+    return sorted(sent, key=lambda s: s[1][0])
+
+
+@pytest.mark.parametrize('count, chunk_size, sizes', [(1001, 500, [500, 500, 1]), (1000, 500, [500, 500]), (3, 1, [1, 1, 1]), (0, 500, [])])
+def test_approve_many_chunks(count, chunk_size, sizes):
+    ids = [f"{i:05}" for i in range(count)]
+    session = FakeSession(*(FakeResponse() for _ in sizes))
+
+    assignments.approve_many('p', ids, chunk_size=chunk_size, session=session, idempotency_token='tok')
+
+    sent = _sent(session, 'participants')
+    assert [len(chunk) for (_, chunk) in sent] == sizes
+    assert [id for (_, chunk) in sent for id in chunk] == ids
+    assert [token for (token, _) in sent] == [f"tok:{i}" for i in range(len(sizes))]
+    assert all(r['url'].endswith('/assignments/p/approve') for r in session.requests)
+
+
+def test_approve_many_without_token():
+    session = FakeSession(FakeResponse(), FakeResponse())
+
+    assignments.approve_many('p', ['a', 'b', 'c'], chunk_size=2, session=session)
+
+    assert [token for (token, _) in _sent(session, 'participants')] == [None, None]
+
+
+@pytest.mark.parametrize('chunk_size', [0, -1])
+def test_chunk_size_must_be_positive(chunk_size):
+    session = FakeSession()
+
+    with pytest.raises(ValueError):
+        assignments.approve_many('p', ['a'], chunk_size=chunk_size, session=session)
+
+    assert session.requests == []
+
+
+def test_bonus_many_with_workers():
+    payments = [(f"{i:04}", 1.5, 'thanks') for i in range(1001)]
+    session = FakeSession(*(FakeResponse() for _ in range(3)))
+
+    assignments.bonus_many('p', payments, max_workers=4, session=session, idempotency_token='tok')
+
+    sent = _sent(session, 'bonusPayment')
+    assert [id for (_, chunk) in sent for id in chunk] == [id for (id, _, _) in payments]
+    assert [token for (token, _) in sent] == ['tok:0', 'tok:1', 'tok:2']
+    assert all((b['amount'], b['message']) == (1.5, 'thanks') for r in session.requests for b in json.loads(r['data'])['bonusPayment'])
+
+
+def test_many_with_workers_raises_errors():
+    session = FakeSession(FakeResponse(), FakeResponse(status_code=400, content=b'{}'))
+
+    with pytest.raises(assignments.base.ApiError):
+        assignments.reject_many('p', ['a', 'b'], 'no', chunk_size=1, max_workers=2, session=session)
@@ -0,0 +1,44 @@
+import asyncio
+
+import pytest
+
+httpx = pytest.importorskip('httpx')
+
+from tism.crconnect import base, project
+
+
+def _client(handler):
+    return httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+
+def test_request_async_discard_response():
+    async def run():
+        async with _client(lambda request: httpx.Response(200, json={ 'ok': True })) as client:
+            return await base.request_async('POST', '/x', json={ 'a': 1 }, discard_response=True, session=client)
+
+    assert asyncio.run(run()) is None
+
+
+def test_request_async_raises_api_error():
+    async def run():
+        async with _client(lambda request: httpx.Response(400, json={ 'error': { 'message': 'bad' } })) as client:
+            await base.request_async('POST', '/x', discard_response=True, session=client)
+
+    with pytest.raises(base.ApiError) as e:
+        asyncio.run(run())
+
+    assert e.value.status_code == 400
+
+
+def test_list_all_async_iterates_every_page():
+    def handler(request):
+        if 'NextToken' in request.url.params:
+            return httpx.Response(200, json={ 'projects': [{ 'id': 'b' }] })
+
+        return httpx.Response(200, json={ 'projects': [{ 'id': 'a' }], 'nextToken': 't' })
+
+    async def run():
+        async with _client(handler) as client:
+            return [p['id'] async for p in project.list_all_async(session=client)]
+
+    assert asyncio.run(run()) == ['a', 'b']
@@ -0,0 +1,168 @@
+import datetime
+
+import pytest
+import requests
+from requests.adapters import HTTPAdapter
+from urllib.parse import parse_qs, urlsplit
+
+from tism.crconnect import base
+
+from conftest import FakeResponse, FakeSession
+
+
+@pytest.mark.parametrize('value', [float('nan'), float('inf'), float('-inf')])
+def test_json_encode_rejects_non_finite_floats(value):
+    with pytest.raises(ValueError):
+        base._json_encode({ 'payment': value })
+
+
+def test_json_dumps_keeps_null():
+    assert base._json_loads(base._json_dumps({ 'projectUrl': None, 'name': 'null' })) == { 'projectUrl': None, 'name': 'null' }
+
+
+def test_json_dumps_doesnt_depend_on_nulls():
+    pytest.importorskip('orjson')
+    day = datetime.date(2024, 1, 2)
+
+    assert base._json_dumps({ 'd': day }) == b'{"d":"2024-01-02"}'
+    assert base._json_dumps({ 'a': None, 'd': day }) == b'{"a":null,"d":"2024-01-02"}'
+
+
+@pytest.mark.parametrize('kwargs, expected', [
+    ({ 'return_response': True }, FakeResponse),
+    ({ 'json_response': False }, bytes),
+])
+def test_cached_get_passes_response_kwargs_through(kwargs, expected):
+    session = FakeSession(FakeResponse(content=b'{"a":1}'), FakeResponse(content=b'{"a":1}'))
+
+    assert isinstance(base.cached_get('/x', 60, session=session, **kwargs), expected)
+    assert isinstance(base.cached_get('/x', 60, session=session, **kwargs), expected)
+    assert len(session.requests) == 2
+
+
+def test_cached_get_reuses_response_within_ttl():
+    session = FakeSession(FakeResponse(content=b'{"a":1}'))
+
+    assert base.cached_get('/x', 60, session=session) == { 'a': 1 }
+    assert base.cached_get('/x', 60, session=session) == { 'a': 1 }
+    assert len(session.requests) == 1
+
+
+def test_cached_get_revalidates_with_etag():
+    session = FakeSession(FakeResponse(content=b'{"a":1}', headers={ 'ETag': '"v1"' }), FakeResponse(status_code=304, content=b''))
+
+    assert base.cached_get('/x', 0, session=session) == { 'a': 1 }
+    assert base.cached_get('/x', 0, session=session) == { 'a': 1 }
+    assert session.requests[1]['headers']['If-None-Match'] == '"v1"'
+
+
+@pytest.mark.parametrize('query', [object(), 42, ['a', 'b']])
+def test_endpoint_url_rejects_non_query_objects(query):
+    with pytest.raises(TypeError):
+        base.endpoint_url('/x', query=query)
+
+
+def test_endpoint_url_accepts_str_and_dict():
+    assert base.endpoint_url('/x', query='a=1') == base.endpoint_url('/x', query={ 'a': 1 }) == f"{base.BASE_URL}/api/v1/x?a=1"
+
+
+def test_cached_get_evicts_least_recently_used(monkeypatch):
+    monkeypatch.setattr(base, 'CACHE_MAXSIZE', 2)
+    session = FakeSession(*(FakeResponse(content=b'{}', headers={ 'ETag': '"v"' }) for _ in range(3)))
+
+    base.cached_get('/a', 60, session=session)
+    base.cached_get('/b', 60, session=session)
+    base.cached_get('/a', 60, session=session)
+    base.cached_get('/c', 60, session=session)
+
+    assert [url.rsplit('/', 1)[1] for (_, url) in base._cache] == ['a', 'c']
+
+
+def test_cached_get_drops_expired_entries_without_etag(monkeypatch):
+    monkeypatch.setattr(base, 'CACHE_MAXSIZE', 2)
+    session = FakeSession(*(FakeResponse(content=b'{}') for _ in range(3)))
+
+    base.cached_get('/b', 60, session=session)
+    base.cached_get('/a', 0, session=session)
+    base.cached_get('/c', 60, session=session)
+
+    assert [url.rsplit('/', 1)[1] for (_, url) in base._cache] == ['b', 'c']
+
+
+@pytest.mark.parametrize('content', [b'<html><body>502 Bad Gateway</body></html>', b''])
+def test_api_error_without_json_body(content):
+    with pytest.raises(base.ApiError) as e:
+        base.get('/x', session=FakeSession(FakeResponse(status_code=502, content=content)))
+
+    assert (e.value.status_code, e.value.data) == (502, None)
+
+
+def _expire(path):
+    # Makes the cached entry look older than its TTL, but still within the stale window.
+    key = next(k for k in base._cache if k[1].endswith(path))
+    (fetched_at, value, etag, usable_until) = base._cache[key]
+    base._cache[key] = (fetched_at - 10, value, etag, usable_until)
+
+
+@pytest.mark.parametrize('error', [
+    FakeResponse(status_code=503, content=b'<html></html>'),
+    FakeResponse(status_code=429, content=b''),
+    requests.ConnectionError('down'),
+])
+def test_cached_get_returns_stale_response_on_transient_error(error):
+    session = FakeSession(FakeResponse(content=b'{"a":1}'), error)
+
+    base.cached_get('/x', 5, session=session, stale_ttl=300)
+    _expire('/x')
+
+    assert base.cached_get('/x', 5, session=session, stale_ttl=300) == { 'a': 1 }
+
+
+def test_cached_get_returns_stale_response_on_httpx_transport_error():
+    httpx = pytest.importorskip('httpx')
+    session = FakeSession(FakeResponse(content=b'{"a":1}'), httpx.ConnectError('down'))
+
+    base.cached_get('/x', 5, session=session, stale_ttl=300)
+    _expire('/x')
+
+    assert base.cached_get('/x', 5, session=session, stale_ttl=300) == { 'a': 1 }
+
+
+def test_cached_get_raises_client_errors_despite_stale_response():
+    session = FakeSession(FakeResponse(content=b'{"a":1}'), FakeResponse(status_code=404, content=b'{}'))
+
+    base.cached_get('/x', 5, session=session, stale_ttl=300)
+    _expire('/x')
+
+    with pytest.raises(base.ApiError):
+        base.cached_get('/x', 5, session=session, stale_ttl=300)
+
+
+@pytest.mark.parametrize('kwargs, expected', [({}, base.DEFAULT_TIMEOUT), ({ 'timeout': None }, base.DEFAULT_TIMEOUT),
+                                              ({ 'timeout': 5 }, 5), ({ 'timeout': (None, None) }, (None, None))])
+def test_create_session_applies_default_timeout(monkeypatch, kwargs, expected):
+    timeouts = []
+
+    def send(self, request, timeout=None, **kwargs):
+        timeouts.append(timeout)
+        raise requests.ConnectionError()
+
+    monkeypatch.setattr(HTTPAdapter, 'send', send)
+    session = base.create_session('key', set_current_session=False)
+
+    with pytest.raises(requests.ConnectionError):
+        base.request('GET', '/x', session=session, **kwargs)
+
+    assert timeouts == [expected]
+
+
+def test_to_query_str_encodes_nested_keys_and_values():
+    assert base.to_query_str({ 'a': { 'b+c': 'x&y' } }) == 'a[b%2Bc]=x%26y'
+    assert base.to_query_str({ 'team': { 'employee': { 'name': 'Scott Tiger' } }, 'q': 1 }) == 'team[employee][name]=Scott+Tiger&q=1'
+
+
+def test_next_token_is_encoded():
+    url = base.endpoint_url('/project', query={ 'status': 'Live', 'NextToken': 'ab+/c==' })
+
+    assert url.endswith('/project?status=Live&NextToken=ab%2B%2Fc%3D%3D')
+    assert parse_qs(urlsplit(url).query)['NextToken'] == ['ab+/c==']
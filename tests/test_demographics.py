@@ -0,0 +1,16 @@
+from tism.crconnect import demographics
+
+from conftest import FakeResponse, FakeSession
+
+
+def test_list_all_uses_passed_session():
+    session = FakeSession(FakeResponse(content=b'{"demographics":[]}'))
+
+    assert demographics.list_all(session=session) == { 'demographics': [] }
+    assert session.requests[0]['url'].endswith('/demographics/list')
+
+
+def test_list_all_returns_response():
+    response = FakeResponse(content=b'{"demographics":[]}')
+
+    assert demographics.list_all(session=FakeSession(response), return_response=True) is response
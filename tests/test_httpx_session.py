@@ -0,0 +1,46 @@
+import pytest
+
+httpx = pytest.importorskip('httpx')
+
+from tism.crconnect import base
+
+
+def _session(handler):
+    return base.HttpxSession(httpx.Client(transport=httpx.MockTransport(handler)))
+
+
+def test_data_is_sent_as_content():
+    bodies = []
+
+    def handler(request):
+        bodies.append((request.headers['Content-Type'], request.content))
+        return httpx.Response(200, json={ 'ok': True })
+
+    with _session(handler) as session:
+        assert base.post('/x', json={ 'a': 1 }, session=session) == { 'ok': True }
+
+    assert bodies == [('application/json', b'{"a":1}')]
+
+
+@pytest.mark.parametrize('allow_redirects, status_code', [(True, 200), (False, 302)])
+def test_allow_redirects_is_follow_redirects(allow_redirects, status_code):
+    def handler(request):
+        if request.url.path.endswith('/old'):
+            return httpx.Response(302, headers={ 'Location': '/api/v1/new' })
+
+        return httpx.Response(200, json={})
+
+    with _session(handler) as session:
+        response = session.request('GET', f"{base.BASE_URL}/api/v1/old", allow_redirects=allow_redirects)
+
+    assert response.status_code == status_code
+
+
+def test_raw_is_created_once():
+    with _session(lambda request: httpx.Response(200, content=b'{"a":1}')) as session:
+        response = session.request('GET', f"{base.BASE_URL}/api/v1/x")
+
+    response.raw.decode_content = True
+
+    assert response.raw.decode_content
+    assert response.raw.read() == b'{"a":1}'
@@ -0,0 +1,144 @@
+import gzip
+import io
+
+import pytest
+import urllib3
+
+from tism.crconnect import project
+
+from conftest import FakeResponse, FakeSession
+
+
+def _pages():
+    return (FakeResponse(content=b'{"projects":[{"id":"a"}],"nextToken":"t"}'),
+            FakeResponse(content=b'{"projects":[{"id":"b"}]}'))
+
+
+def test_list_all_iterates_every_page():
+    session = FakeSession(*_pages())
+
+    assert [p['id'] for p in project.list_all(session=session)] == ['a', 'b']
+    assert session.requests[1]['url'].endswith('?NextToken=t')
+
+
+def test_list_all_doesnt_prefetch_by_default():
+    session = FakeSession(*_pages())
+
+    assert next(iter(project.list_all(session=session)))['id'] == 'a'
+    assert len(session.requests) == 1
+
+
+def test_list_all_prefetch():
+    session = FakeSession(*_pages())
+
+    assert [p['id'] for p in project.list_all(session=session, prefetch=True)] == ['a', 'b']
+
+
+def test_retrieve_is_cached():
+    session = FakeSession(FakeResponse(content=b'{"project":{"id":"p"}}'))
+
+    assert project.retrieve('p', session=session) is project.retrieve('p', session=session)
+    assert len(session.requests) == 1
+
+
+def test_retrieve_passes_response_kwargs_through():
+    response = FakeResponse(content=b'{"project":{"id":"p"}}')
+
+    assert project.retrieve('p', session=FakeSession(response), return_response=True) is response
+    assert project.retrieve('p', session=FakeSession(response), json_response=False) == response.content
+
+
+_PROJECT = { 'name': 'n', 'payment': 1.5, 'estimatedTimeInMinutes': 5, 'participants': 10 }
+
+
+def test_check_project_data_requires_keys_only_when_creating():
+    with pytest.raises(ValueError):
+        project._check_new_project_data({ 'name': 'n' })
+
+    assert project._check_project_data({ 'name': 'n' }) == { 'name': 'n' }
+
+
+@pytest.mark.parametrize('field', [{ 'participants': '10' }, { 'participants': True }, { 'payment': 'free' }])
+def test_check_project_data_rejects_wrong_types(field):
+    with pytest.raises(TypeError):
+        project._check_project_data({ **_PROJECT, **field })
+
+
+@pytest.mark.parametrize('payment', [float('nan'), float('inf')])
+def test_check_project_data_rejects_non_finite_floats(payment):
+    with pytest.raises(ValueError):
+        project._check_project_data({ **_PROJECT, 'payment': payment })
+
+
+@pytest.mark.parametrize('field', [{ 'systemRequirements': ['Audio', 'Speaker'] }, { 'systemRequirements': [['Audio']] }])
+def test_check_project_data_rejects_invalid_enum_values(field):
+    with pytest.raises(ValueError):
+        project._check_project_data({ **_PROJECT, **field })
+
+
+def test_check_project_data_converts_enums():
+    data = project._check_project_data({ **_PROJECT, 'deviceRequirements': [project.DeviceType.DESKTOP] })
+
+    assert type(data['deviceRequirements'][0]) is str
+
+
+def test_check_project_data_doesnt_visit_task_template_rows():
+    rows = [{ 'cells': [{ 'value': 1 }] }]
+    task_template = { 'taskTemplateType': 'DataLabeling', 'headers': ['a'], 'data': rows }
+
+    assert project._check_new_project_data({ **_PROJECT, 'taskTemplate': task_template })['taskTemplate']['data'] is rows
+
+
+def _streamed(*bodies, compress=False):
+    # Responses whose raw body is read by ijson through urllib3, as with stream=True.
+    responses = []
+
+    for body in bodies:
+        headers = { 'Content-Encoding': 'gzip' } if compress else {}
+        raw = urllib3.HTTPResponse(body=io.BytesIO(gzip.compress(body) if compress else body), headers=headers,
+                                   preload_content=False)
+        response = FakeResponse(content=None)
+        response.raw = raw
+        responses.append(response)
+
+    return FakeSession(*responses)
+
+
+_STREAMED_PAGES = (
+    # The token may come before or after the projects, and projects may contain nested maps and lists.
+    b'{"nextToken":"t","projects":[{"projectId":"a","completionSettings":{"codes":[{"x":1},[2]]}},{"projectId":"b"}]}',
+    b'{"projects":[{"projectId":"c","platformTargeting":{}}],"nextToken":"u"}',
+    b'{"projects":[]}',
+)
+
+
+@pytest.mark.parametrize('compress', [False, True])
+def test_stream_items_iterates_every_page(compress):
+    pytest.importorskip('ijson')
+    session = _streamed(*_STREAMED_PAGES, compress=compress)
+
+    projects = list(project.list_all(session=session, stream_items=True))
+
+    assert [p['projectId'] for p in projects] == ['a', 'b', 'c']
+    assert projects[0]['completionSettings'] == { 'codes': [{ 'x': 1 }, [2]] }
+    assert [r['url'].rsplit('?', 1)[-1] for r in session.requests[1:]] == ['NextToken=t', 'NextToken=u']
+
+
+def test_stream_items_as_record():
+    pytest.importorskip('ijson')
+    session = _streamed(*_STREAMED_PAGES)
+
+    records = list(project.list_all(session=session, stream_items=True, as_record=True))
+
+    assert all(isinstance(r, project.ProjectResponseRecord) for r in records)
+    assert [r.projectId for r in records] == ['a', 'b', 'c']
+    assert records[2].platformTargeting == {}
+
+
+def test_stream_items_matches_pages():
+    pytest.importorskip('ijson')
+
+    streamed = list(project.list_all(session=_streamed(*_STREAMED_PAGES), stream_items=True))
+    parsed = list(project.list_all(session=FakeSession(*(FakeResponse(content=b) for b in _STREAMED_PAGES))))
+
+    assert streamed == parsed
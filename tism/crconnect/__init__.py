@@ -1,7 +1,22 @@
 # -*- coding: utf-8 -*-
 
-__all__ = ['account', 'assignments', 'demographics', 'project', 'create_session', 'ApiError', 'ApiErrorData']
+__all__ = ['account', 'assignments', 'demographics', 'project', 'create_session', 'get_current_session', 'create_async_session', 'HttpClient', 'ApiError', 'ApiErrorData']
 __version__ = '0.2.1'
 
-from .base import create_session, ApiError, ApiErrorData
-from . import account, assignments, demographics, project
+import importlib
+
+from .base import create_session, get_current_session, create_async_session, HttpClient, ApiError, ApiErrorData
+
+_SUBMODULES = frozenset(['account', 'assignments', 'demographics', 'project'])
+
+def __getattr__(name: str):
+    # Import the API submodules on first use (PEP 562).
+    if name in _SUBMODULES:
+        module = importlib.import_module(f'.{name}', __name__)
+        globals()[name] = module
+        return module
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+def __dir__():
+    return sorted(set(globals()) | _SUBMODULES)
@@ -1,18 +1,21 @@
 # -*- coding: utf-8 -*-
 
-from requests import Session
-from typing import TypedDict, Optional
-from typing_extensions import Required
+from decimal import Decimal
+from typing import Optional
+from typing_extensions import Required, TypedDict
 from . import base
+from .base import HttpClient
 
 class AccountInfo(TypedDict):
-    accountBalance: Required[float]
+    accountBalance: Required[Decimal]
     """The available balance that is left in your account."""
 
-def get_info(session: Optional[Session]=None, **kwargs) -> AccountInfo:
+def get_info(session: Optional[HttpClient]=None, **kwargs) -> AccountInfo:
     """
     Retrieve account information.
 
+    The account balance is parsed as a `Decimal` so that it can be used in calculations without rounding errors.
+
     Args:
         session: The Requests session to use for the base. If `None`, use the last session that was created
         by `base.create_session()`.
@@ -23,4 +26,4 @@ def get_info(session: Optional[Session]=None, **kwargs) -> AccountInfo:
             400 - Bad Request.
             401 - Invalid API key or unauthorized resource access.
     """
-    return base.get("/account", session=session, **kwargs)
+    return base.get("/account", session=session, parse_decimal=True, **kwargs)
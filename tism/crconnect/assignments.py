@@ -14,16 +14,25 @@ If assignments are `Rejected`, your account balance will be credited with the am
 the participants plus any associated Connect fees.
 """
 
-from enum import auto
-from typing import Optional, TypedDict
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from itertools import islice
+from typing import Any, Literal, Optional
+from typing_extensions import TypedDict
 
-from requests import Session
-from strenum import PascalCaseStrEnum
 from . import base
+from .base import HttpClient
 
-class SubmissionType(PascalCaseStrEnum):
-    COMPLETION_CODE = auto()
-    REDIRECT = auto()
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+SubmissionType = Literal['CompletionCode', 'Redirect']
+
+COMPLETION_CODE: SubmissionType = 'CompletionCode'
+REDIRECT: SubmissionType = 'Redirect'
 
 class CompletionInfo(TypedDict):
     completionCode: Optional[str]
@@ -35,10 +44,11 @@ class CompletionInfo(TypedDict):
     submissionType: SubmissionType
     """The submission method used by the participant to complete the project."""
 
-class AssignmentStatus(PascalCaseStrEnum):
-    PENDING = auto()
-    APPROVED = auto()
-    REJECTED = auto()
+AssignmentStatus = Literal['Pending', 'Approved', 'Rejected']
+
+PENDING: AssignmentStatus = 'Pending'
+APPROVED: AssignmentStatus = 'Approved'
+REJECTED: AssignmentStatus = 'Rejected'
 
 class Assignment(TypedDict):
     participantId: Optional[str]
@@ -65,6 +75,43 @@ class Assignment(TypedDict):
     """Information on how the participant submitted the project."""
 
 
+@dataclass(slots=True, frozen=True)
+class AssignmentRow:
+    """
+    A compact, immutable alternative to `Assignment` for holding large numbers of assignments in memory.
+
+    Unlike a `dict`, each row stores its fields in fixed slots, which uses considerably less memory.
+    """
+
+    participantId: Optional[str]
+    assignmentId: Optional[str]
+    startTime: str
+    completionTime: Optional[str]
+    status: AssignmentStatus
+    payment: float
+    bonus: float
+    completion: CompletionInfo
+
+    @classmethod
+    def from_dict(cls, data: Assignment) -> 'AssignmentRow':
+        """Create a row from an assignment returned by the API (unknown keys are ignored)."""
+        return cls(data.get('participantId'), data.get('assignmentId'), data.get('startTime'),
+                   data.get('completionTime'), data.get('status'), data.get('payment'), data.get('bonus'),
+                   data.get('completion'))
+
+    def to_dict(self) -> Assignment:
+        """Convert the row back into an `Assignment` dict."""
+        return {
+            'participantId': self.participantId,
+            'assignmentId': self.assignmentId,
+            'startTime': self.startTime,
+            'completionTime': self.completionTime,
+            'status': self.status,
+            'payment': self.payment,
+            'bonus': self.bonus,
+            'completion': self.completion,
+        }
+
 class AssignmentResponse(TypedDict):
     assignments: Optional[list[Assignment]]
 
@@ -85,7 +132,50 @@ class BonusPayment(TypedDict, total=False):
     amount: float
     """The amount to bonus."""
 
-def list_all(project_id: str, session: Optional[Session] = None, **kwargs) -> AssignmentResponse:
+DEFAULT_CHUNK_SIZE = 500
+"""The default maximum number of participants sent in a single batched request."""
+
+def _chunks(items: Iterable, chunk_size: int) -> Iterator[list]:
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be at least 1")
+
+    it = iter(items)
+
+    while chunk := list(islice(it, chunk_size)):
+        yield chunk
+
+def _chunk_token(idempotency_token: Optional[str], index: int) -> Optional[str]:
+    return f"{idempotency_token}:{index}" if idempotency_token is not None else None
+
+def _send_chunks(send: Callable[..., None], project_id: str, items: Iterable, chunk_size: int, max_workers: int,
+                 session: Optional[HttpClient], idempotency_token: Optional[str], **kwargs) -> None:
+    if max_workers <= 1:
+        for (i, chunk) in enumerate(_chunks(items, chunk_size)):
+            send(project_id, chunk, session=session, idempotency_token=_chunk_token(idempotency_token, i), **kwargs)
+        return
+
+    # Worker threads don't inherit the caller's context, so resolve the session up front.
+    if session is None:
+        session = base.get_current_session()
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [executor.submit(send, project_id, chunk, session=session,
+                                   idempotency_token=_chunk_token(idempotency_token, i), **kwargs)
+                   for (i, chunk) in enumerate(_chunks(items, chunk_size))]
+
+    for future in futures:
+        future.result()
+
+def _submit(project_id: str, action: str, key: str, payload: Any, session: Optional[HttpClient],
+            idempotency_token: Optional[str], **kwargs) -> None:
+    base.post(f"/assignments/{project_id}/{action}",
+              json={ key: payload },
+              session=session,
+              idempotency_token=idempotency_token,
+              discard_response=True,
+              **kwargs)
+
+def list_all(project_id: str, session: Optional[HttpClient] = None, **kwargs) -> AssignmentResponse:
     """
     List all assignments for a project.
 
@@ -105,7 +195,65 @@ def list_all(project_id: str, session: Optional[Session] = None, **kwargs) -> As
     """
     return base.get(f'/assignments/{project_id}', session=session, **kwargs)
 
-def approve(project_id: str, participants: list[Participant], session: Optional[Session] = None, idempotency_token: Optional[str]=None, **kwargs) -> None:
+def list_all_iter(project_id: str, session: Optional[HttpClient] = None, **kwargs) -> Iterator[Assignment]:
+    """
+    Iterate over all assignments for a project as the response is downloaded.
+
+    If [ijson](https://pypi.org/project/ijson/) is installed, assignments are parsed and yielded
+    incrementally so that the whole response never has to be held in memory at once. Otherwise
+    (or with a session created with `backend='httpx'`, which always reads the whole response),
+    the response is parsed in full before the first assignment is yielded.
+
+    Args:
+        project_id: The project ID.
+        session: The current Requests session. If `None`, use the last session that was created
+        by `base.create_session()`.
+        kwargs: Additional arguments to be passed to `session.request()`.
+
+    Returns:
+        An iterator over the project's assignments.
+
+    Raises:
+        ApiError:
+            400 - Bad Request.
+            401 - Invalid API or unauthorized resource access.
+    """
+    response = base.stream_get(f'/assignments/{project_id}', session=session, **kwargs)
+
+    try:
+        if ijson is None:
+            yield from base._json_loads(response.content).get('assignments') or ()
+        else:
+            # Let urllib3 undo any gzip/deflate content encoding while ijson reads from the socket.
+            response.raw.decode_content = True
+            yield from ijson.items(response.raw, 'assignments.item', use_float=True)
+    finally:
+        response.close()
+
+def list_all_rows(project_id: str, session: Optional[HttpClient] = None, **kwargs) -> list[AssignmentRow]:
+    """
+    List all assignments for a project as `AssignmentRow`s.
+
+    Assignments are converted as they are parsed by `list_all_iter()`, so only the compact rows are
+    kept in memory.
+
+    Args:
+        project_id: The project ID.
+        session: The current Requests session. If `None`, use the last session that was created
+        by `base.create_session()`.
+        kwargs: Additional arguments to be passed to `session.request()`.
+
+    Returns:
+        A list of assignments.
+
+    Raises:
+        ApiError:
+            400 - Bad Request.
+            401 - Invalid API or unauthorized resource access.
+    """
+    return [AssignmentRow.from_dict(a) for a in list_all_iter(project_id, session=session, **kwargs)]
+
+def approve(project_id: str, participants: list[Participant], session: Optional[HttpClient] = None, idempotency_token: Optional[str]=None, **kwargs) -> None:
     """
     Approve participants associated with a project.
 
@@ -122,16 +270,9 @@ def approve(project_id: str, participants: list[Participant], session: Optional[
             400 - Bad Request.
             401 - Invalid API or unauthorized resource access.
     """
-    base.post(f"/assignments/{project_id}/approve",
-                 json={
-                     'participants': participants
-                 },
-                 session=session,
-                 idempotency_token=idempotency_token,
-                 json_response=False,
-                 **kwargs)
+    _submit(project_id, 'approve', 'participants', participants, session, idempotency_token, **kwargs)
 
-def approve_all(project_id: str, message: Optional[str]=None, session: Optional[Session] = None, idempotency_token: Optional[str]=None, **kwargs) -> None:
+def approve_all(project_id: str, message: Optional[str]=None, session: Optional[HttpClient] = None, idempotency_token: Optional[str]=None, **kwargs) -> None:
     """
     Approve all participants associated with a project.
 
@@ -148,16 +289,9 @@ def approve_all(project_id: str, message: Optional[str]=None, session: Optional[
             400 - Bad Request.
             401 - Invalid API or unauthorized resource access.
     """
-    base.post(f"/assignments/{project_id}/approve-all",
-                 json={
-                     'message': message if message is not None else ''
-                 },
-                 session=session,
-                 idempotency_token=idempotency_token,
-                 json_response=False,
-                 **kwargs)
+    _submit(project_id, 'approve-all', 'message', message if message is not None else '', session, idempotency_token, **kwargs)
 
-def reject(project_id: str, participants: list[Participant], session: Optional[Session] = None, idempotency_token: Optional[str]=None, **kwargs) -> None:
+def reject(project_id: str, participants: list[Participant], session: Optional[HttpClient] = None, idempotency_token: Optional[str]=None, **kwargs) -> None:
     """
     Reject participants associated with a project
 
@@ -179,16 +313,9 @@ def reject(project_id: str, participants: list[Participant], session: Optional[S
             400 - Bad Request.
             401 - Invalid API or unauthorized resource access.
     """
-    base.post(f"/assignments/{project_id}/reject",
-                 json={
-                     'participants': participants
-                 },
-                 session=session,
-                 idempotency_token=idempotency_token,
-                 json_response=False,
-                 **kwargs)
+    _submit(project_id, 'reject', 'participants', participants, session, idempotency_token, **kwargs)
 
-def bonus(project_id: str, bonus_payments: list[BonusPayment], session: Optional[Session] = None, idempotency_token: Optional[str]=None, **kwargs) -> None:
+def bonus(project_id: str, bonus_payments: list[BonusPayment], session: Optional[HttpClient] = None, idempotency_token: Optional[str]=None, **kwargs) -> None:
     """
     Bonus participants associated with a project
 
@@ -209,16 +336,9 @@ def bonus(project_id: str, bonus_payments: list[BonusPayment], session: Optional
             400 - Bad Request.
             401 - Invalid API or unauthorized resource access.
     """
-    base.post(f"/assignments/{project_id}/bonus",
-                 json={
-                     'bonusPayment': bonus_payments
-                 },
-                 session=session,
-                 idempotency_token=idempotency_token,
-                 json_response=False,
-                 **kwargs)
+    _submit(project_id, 'bonus', 'bonusPayment', bonus_payments, session, idempotency_token, **kwargs)
 
-def reverse_rejections(project_id: str, participants: list[Participant], session: Optional[Session] = None, idempotency_token: Optional[str]=None, **kwargs) -> None:
+def reverse_rejections(project_id: str, participants: list[Participant], session: Optional[HttpClient] = None, idempotency_token: Optional[str]=None, **kwargs) -> None:
     """
     Reverse Rejections for previously Rejected assignments for a project.
 
@@ -239,11 +359,115 @@ def reverse_rejections(project_id: str, participants: list[Participant], session
             400 - Bad Request.
             401 - Invalid API or unauthorized resource access.
     """
-    base.post(f"/assignments/{project_id}/reverse-reject",
-                 json={
-                     'participants': participants
-                 },
-                 session=session,
-                 idempotency_token=idempotency_token,
-                 json_response=False,
-                 **kwargs)
+    _submit(project_id, 'reverse-reject', 'participants', participants, session, idempotency_token, **kwargs)
+
+def approve_many(project_id: str, ids: Iterable[str], message: str = '', chunk_size: int = DEFAULT_CHUNK_SIZE, max_workers: int = 1,
+                 session: Optional[HttpClient] = None, idempotency_token: Optional[str] = None, **kwargs) -> None:
+    """
+    Approve any number of participants associated with a project using as few requests as possible.
+
+    The participants are split into chunks of at most `chunk_size` and each chunk is sent with `approve()`.
+    If an idempotency token is given, the token for each chunk is `"{idempotency_token}:{chunk index}"`.
+
+    Args:
+        project_id: The project ID.
+        ids: The participant or assignment IDs to approve.
+        message: The feedback message to be sent to every participant.
+        chunk_size: The maximum number of participants per request.
+        max_workers: The number of chunks to send concurrently (using a thread pool) if greater than 1.
+        session: The current Requests session. If `None`, use the last session that was created
+        by `base.create_session()`.
+        idempotency_token: A string used to identify this batch of requests to prevent duplicates.
+        kwargs: Additional arguments to be passed to `session.request()`.
+
+    Raises:
+        ApiError:
+            400 - Bad Request.
+            401 - Invalid API or unauthorized resource access.
+    """
+    _send_chunks(approve, project_id, ({ 'id': id, 'message': message } for id in ids), chunk_size, max_workers,
+                 session, idempotency_token, **kwargs)
+
+def reject_many(project_id: str, ids: Iterable[str], message: str, chunk_size: int = DEFAULT_CHUNK_SIZE, max_workers: int = 1,
+                session: Optional[HttpClient] = None, idempotency_token: Optional[str] = None, **kwargs) -> None:
+    """
+    Reject any number of participants associated with a project using as few requests as possible.
+
+    The participants are split into chunks of at most `chunk_size` and each chunk is sent with `reject()`.
+    If an idempotency token is given, the token for each chunk is `"{idempotency_token}:{chunk index}"`.
+
+    Args:
+        project_id: The project ID.
+        ids: The participant or assignment IDs to reject.
+        message: The reason for the rejection to be sent to every participant.
+        chunk_size: The maximum number of participants per request.
+        max_workers: The number of chunks to send concurrently (using a thread pool) if greater than 1.
+        session: The current Requests session. If `None`, use the last session that was created
+        by `base.create_session()`.
+        idempotency_token: A string used to identify this batch of requests to prevent duplicates.
+        kwargs: Additional arguments to be passed to `session.request()`.
+
+    Raises:
+        ApiError:
+            400 - Bad Request.
+            401 - Invalid API or unauthorized resource access.
+    """
+    _send_chunks(reject, project_id, ({ 'id': id, 'message': message } for id in ids), chunk_size, max_workers,
+                 session, idempotency_token, **kwargs)
+
+def bonus_many(project_id: str, payments: Iterable[tuple[str, float, Optional[str]]], chunk_size: int = DEFAULT_CHUNK_SIZE, max_workers: int = 1,
+               session: Optional[HttpClient] = None, idempotency_token: Optional[str] = None, **kwargs) -> None:
+    """
+    Bonus any number of participants associated with a project using as few requests as possible.
+
+    The payments are split into chunks of at most `chunk_size` and each chunk is sent with `bonus()`.
+    If an idempotency token is given, the token for each chunk is `"{idempotency_token}:{chunk index}"`.
+
+    Note: Funds are checked per request, so if the account runs out of funds part way through, the
+    chunks that were already sent will have been paid.
+
+    Args:
+        project_id: The project ID.
+        payments: `(id, amount, message)` tuples for each bonus payment.
+        chunk_size: The maximum number of payments per request.
+        max_workers: The number of chunks to send concurrently (using a thread pool) if greater than 1.
+        session: The current Requests session. If `None`, use the last session that was created
+        by `base.create_session()`.
+        idempotency_token: A string used to identify this batch of requests to prevent duplicates.
+        kwargs: Additional arguments to be passed to `session.request()`.
+
+    Raises:
+        ApiError:
+            400 - Bad Request.
+            401 - Invalid API or unauthorized resource access.
+    """
+    _send_chunks(bonus, project_id,
+                 ({ 'id': id, 'amount': amount, 'message': message } for (id, amount, message) in payments),
+                 chunk_size, max_workers, session, idempotency_token, **kwargs)
+
+def reverse_rejections_many(project_id: str, ids: Iterable[str], message: str = '', chunk_size: int = DEFAULT_CHUNK_SIZE, max_workers: int = 1,
+                            session: Optional[HttpClient] = None, idempotency_token: Optional[str] = None, **kwargs) -> None:
+    """
+    Reverse rejections for any number of participants associated with a project using as few requests as possible.
+
+    The participants are split into chunks of at most `chunk_size` and each chunk is sent with `reverse_rejections()`.
+    If an idempotency token is given, the token for each chunk is `"{idempotency_token}:{chunk index}"`.
+
+    Args:
+        project_id: The project ID.
+        ids: The participant or assignment IDs whose rejections should be reversed.
+        message: The feedback message to be sent to every participant.
+        chunk_size: The maximum number of participants per request.
+        max_workers: The number of chunks to send concurrently (using a thread pool) if greater than 1.
+        session: The current Requests session. If `None`, use the last session that was created
+        by `base.create_session()`.
+        idempotency_token: A string used to identify this batch of requests to prevent duplicates.
+        kwargs: Additional arguments to be passed to `session.request()`.
+
+    Raises:
+        ApiError:
+            400 - Bad Request.
+            401 - Invalid API or unauthorized resource access.
+    """
+    _send_chunks(reverse_rejections, project_id, ({ 'id': id, 'message': message } for id in ids), chunk_size, max_workers,
+                 session, idempotency_token, **kwargs)
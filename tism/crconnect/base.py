@@ -1,13 +1,113 @@
 # -*- coding: utf-8 -*-
 
+import contextvars
+import functools
+import io
+import json
+import logging
+import math
 import requests
+import sys
+import threading
+import time
+from decimal import Decimal
+from enum import Enum
 from requests import Session
-from typing import Iterator, Mapping, Optional, Any, TypedDict
-from typing_extensions import override
+from requests.adapters import HTTPAdapter
+from urllib3.util import make_headers
+from urllib3.util.retry import Retry
+from typing import Callable, Literal, Mapping, MutableMapping, Optional, Any, Protocol, TypedDict, Union
+from typing_extensions import override, get_args, get_origin, get_type_hints, is_typeddict
+from urllib.parse import quote_plus
+
+# Reuse one compact (no whitespace, unescaped non-ASCII) encoder, which keeps large payloads such as
+# task templates small and still runs on the json module's C accelerated encoder. Like Requests, NaN and
+# infinite floats are rejected with a ValueError rather than sent as invalid JSON.
+_json_encode = json.JSONEncoder(ensure_ascii=False, separators=(',', ':'), allow_nan=False).encode
+
+try:
+    import orjson
+
+    def _json_dumps(obj: Any) -> bytes:
+        # Like the json module, accept dicts with non-str keys (e.g. ints) instead of raising. orjson writes
+        # NaN and infinite floats as null; the float fields of checked payloads (see compile_checker()) reject them.
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+
+    _json_loads = orjson.loads
+except ImportError:
+    def _json_dumps(obj: Any) -> bytes:
+        return _json_encode(obj).encode('utf-8')
+
+    _json_loads = json.loads
+
+def _json_loads_decimal(content: bytes) -> Any:
+    # orjson can't produce Decimals, so monetary responses always go through the standard library.
+    return json.loads(content, parse_float=Decimal)
 
 BASE_URL = 'https://connect-api.cloudresearch.com'
 
-CURRENT_SESSION: Optional[Session] = None
+_V1_PREFIX = f"{BASE_URL}/api/v1"
+
+class HttpClient(Protocol):
+    '''
+    The interface a session must provide to send API requests.
+
+    Both a Requests `Session` and an `HttpxSession` (see `create_session(backend='httpx')`) satisfy it.
+    '''
+
+    @property
+    def headers(self) -> MutableMapping[str, str]:
+        # Read-only, so that sessions exposing their headers as a property (e.g. `HttpxSession`) also qualify.
+        ...
+
+    @property
+    def request(self) -> Callable[..., Any]:
+        # Called as `request(method=..., url=..., **kwargs)`. Typed loosely, since Requests declares each argument.
+        ...
+
+CURRENT_SESSION: Optional[HttpClient] = None
+'''The process-wide default session, used when no session has been set for the current thread or context.'''
+
+_logger = logging.getLogger(__name__)
+
+_cache: dict[tuple[str, str], tuple[float, Any, Optional[str], float]] = {}
+'''
+Cached GET responses keyed by `(api key, url)`, holding `(time fetched, value, ETag, time no longer usable)`.
+Entries are ordered from least to most recently used.
+'''
+
+_cache_lock = threading.Lock()
+
+CACHE_MAXSIZE = 256
+'''The maximum number of responses kept by `cached_get()`. The least recently used ones are removed first.'''
+
+_current_session: contextvars.ContextVar[Optional[HttpClient]] = contextvars.ContextVar('crconnect_session', default=None)
+
+POOL_CONNECTIONS = 4
+'''The number of connection pools to cache (all API calls go to the same host).'''
+
+POOL_MAXSIZE = 32
+'''The maximum number of connections to keep alive in each pool.'''
+
+ACCEPT_ENCODING = make_headers(accept_encoding=True)['accept-encoding']
+'''
+The response encodings to accept. urllib3 includes `br` (and `zstd`) only when a decoder for it is installed,
+so install the `brotli` extra to receive Brotli compressed responses.
+'''
+
+DEFAULT_TIMEOUT = 30
+'''
+The timeout, in seconds, of requests sent with a session created by `create_session()` without a `timeout`
+(or with `timeout=None`). Pass `timeout=(None, None)` to disable it.
+'''
+
+MAX_RETRIES = Retry(total=3, backoff_factor=0.3, status_forcelist=(429, 500, 502, 503, 504),
+                    raise_on_status=False)
+'''
+The retry policy for transient failures. Only idempotent methods are retried, since a
+retried POST without an idempotency token could, for example, pay a bonus twice. Once
+retries are exhausted, the last response is returned so that it is raised as an `ApiError`.
+'''
 
 class SessionException(Exception):
     pass
@@ -37,18 +137,6 @@ class ApiError(Exception):
             case _:
                 self.data = None
 
-def _to_query_str(query_dict: Mapping[Any, Any], acc: Optional[str] = None) -> Iterator:
-    for (key, value) in query_dict.items():
-        match value:
-            case dict() if acc is None:
-                yield '&'.join(_to_query_str(value, str(key)))
-            case dict() if acc is not None:
-                yield '&'.join(_to_query_str(value, f"{acc}[{str(key)}]"))
-            case _ if acc is None:
-                yield f"{str(key)}={str(value)}"
-            case _ if acc is not None:
-                yield f"{acc}[{str(key)}]={str(value)}"
-
 def to_query_str(query_dict: Mapping[Any, Any]) -> str:
     '''
     Convert a dict of values into a query string.
@@ -59,8 +147,7 @@ def to_query_str(query_dict: Mapping[Any, Any]) -> str:
     
     >>> { 'team': { 'employee': { 'name': 'Scott' } } }
 
-    Note: This assumes that the `str` representation of the keys and values of the `dict` only contain
-    URL-safe characters.
+    Keys and values are URL-encoded with `urllib.parse.quote_plus()`.
 
     Args:
         query_dict: A `dict` of key/value pairs. Both the key and the value must be able
@@ -69,7 +156,24 @@ def to_query_str(query_dict: Mapping[Any, Any]) -> str:
     Returns:
         A query string.
     '''
-    return '&'.join(_to_query_str(query_dict))
+    parts = []
+
+    # Walk nested dicts with an explicit stack (in reverse, so keys come out in their original order).
+    stack = [(quote_plus(str(key)), value) for (key, value) in reversed(query_dict.items())]
+
+    while stack:
+        (key, value) = stack.pop()
+
+        if isinstance(value, Mapping):
+            stack.extend((f"{key}[{quote_plus(str(k))}]", v) for (k, v) in reversed(value.items()))
+        else:
+            parts.append(f"{key}={quote_plus(str(value))}")
+
+    return '&'.join(parts)
+
+@functools.lru_cache(maxsize=128)
+def _format_url(path: str, version: str) -> str:
+    return _V1_PREFIX + path if version == 'v1' else f"{BASE_URL}/api/{version}{path}"
 
 def endpoint_url(path: str, version: str = 'v1', query: Optional[str | Mapping[Any, Any]] = None) -> str:
     '''
@@ -82,48 +186,347 @@ def endpoint_url(path: str, version: str = 'v1', query: Optional[str | Mapping[A
     
     Returns:
         An endpoint URL `str`.
+
+    Raises:
+        TypeError: `query` isn't a `str`, a mapping or `None` (e.g. a session was passed positionally).
+    '''
+
+    # FIXME: path should be cleaned/validated to ensure that it can form a valid URL.
+
+    if query is None and version == 'v1':
+        return _V1_PREFIX + path
+
+    url = _format_url(path, version)
+
+    if isinstance(query, str):
+        return f"{url}?{query}"
+    elif isinstance(query, Mapping):
+        return f"{url}?{to_query_str(query)}"
+    elif query is None:
+        return url
+    else:
+        raise TypeError(f"query must be a str or a mapping, not {type(query).__name__}")
+
+@functools.cache
+def freeze_enum(cls: type[Enum]) -> dict[Any, str]:
+    '''
+    Build a lookup table from the members of a `str` enum to their interned plain `str` values.
+
+    Since the members of a `str` enum compare and hash equal to their values, the table can also be
+    indexed by the values themselves. Each member's `value` is replaced with the interned `str` as well.
+
+    Args:
+        cls: An enum class whose values are `str`s.
+
+    Returns:
+        A `dict` mapping each member to its value.
+    '''
+    values = {}
+
+    for member in cls:
+        member._value_ = values[member] = sys.intern(str(member.value))
+
+    return values
+
+# The JSON primitive field types that are checked, and the Python types accepted for each.
+_PRIMITIVE_TYPES = { str: (str,), int: (int,), float: (int, float), bool: (bool,) }
+
+def _value_converter(hint: Any) -> Optional[Callable[[Any], Any]]:
+    # Returns None for types whose values are sent as-is, so that only fields that need work are visited.
+    origin = get_origin(hint)
+    args = get_args(hint)
+
+    if origin is Union:
+        converters = [c for c in (_value_converter(a) for a in args if a is not type(None)) if c is not None]
+        return converters[0] if len(converters) == 1 else None
+    elif origin is Literal:
+        allowed = frozenset(args)
+
+        def check_literal(value):
+            try:
+                if value in allowed:
+                    return value
+            except TypeError:
+                pass
+
+            raise ValueError(f"{value!r} is not one of {sorted(allowed)}")
+
+        return check_literal
+    elif origin is list:
+        item = _value_converter(args[0]) if args else None
+        return (lambda values: [item(v) for v in values]) if item is not None else None
+    elif isinstance(hint, type) and issubclass(hint, Enum):
+        # Validates the value and sends the member's plain str value.
+        values = freeze_enum(hint)
+
+        def check_enum(value):
+            try:
+                return values[value]
+            except (KeyError, TypeError):
+                raise ValueError(f"{value!r} is not a valid {hint.__name__}") from None
+
+        return check_enum
+    elif is_typeddict(hint):
+        return _typeddict_converter(hint)
+    else:
+        return None
+
+def _primitive_type(hint: Any) -> Optional[type]:
+    # The primitive type of a `str`, `int`, `float` or `bool` field (which may be Optional), otherwise None.
+    if get_origin(hint) is Union:
+        args = [a for a in get_args(hint) if a is not type(None)]
+        hint = args[0] if len(args) == 1 else None
+
+    return hint if hint in _PRIMITIVE_TYPES else None
+
+def _convert_fields(data: Mapping[str, Any], converters: tuple[tuple[str, Callable[[Any], Any]], ...]) -> Mapping[str, Any]:
+    # Only copies `data` once a value is actually replaced.
+    result = data
+
+    for (key, converter) in converters:
+        if (value := data.get(key)) is not None and (converted := converter(value)) is not value:
+            if result is data:
+                result = dict(data)
+
+            result[key] = converted
+
+    return result
+
+@functools.cache
+def _typeddict_converter(cls: type) -> Optional[Callable[[Mapping[str, Any]], Mapping[str, Any]]]:
+    converters = tuple((key, converter) for (key, hint) in get_type_hints(cls).items()
+                       if (converter := _value_converter(hint)) is not None)
+
+    if not converters:
+        return None
+
+    return lambda data: _convert_fields(data, converters)
+
+@functools.cache
+def compile_checker(cls: type, required: bool = False) -> Optional[Callable[[Mapping[str, Any]], Mapping[str, Any]]]:
+    '''
+    Build a function that checks and converts `dict`s of a `TypedDict` type before they are sent.
+
+    The field types of `cls` are inspected once. The returned function replaces the values of enum fields
+    (including those in nested `TypedDict`s and lists) with their `str` values, and raises `ValueError` for
+    values that aren't members of the enum or `Literal`. Only the `str`, `int`, `float` and `bool` fields
+    of `cls` itself are type checked, raising `TypeError` for values of another type and `ValueError` for
+    NaN or infinite `float`s. Nested `TypedDict`s and lists are only visited if they contain enum or
+    `Literal` fields, so e.g. the rows of a task template are never visited. A `dict` is only copied if
+    one of its values is replaced.
+
+    Args:
+        cls: A `TypedDict` class.
+        required: Also raise `ValueError` if any of the required keys of `cls` are missing (e.g. when
+        creating rather than editing a resource). Only the keys of `cls` itself are checked.
+
+    Returns:
+        The checker function, or `None` if no field of `cls` needs to be checked.
+    '''
+
+    hints = get_type_hints(cls)
+    converters = tuple((key, converter) for (key, hint) in hints.items()
+                       if (converter := _value_converter(hint)) is not None)
+    type_checks = tuple((key, primitive, _PRIMITIVE_TYPES[primitive]) for (key, hint) in hints.items()
+                        if (primitive := _primitive_type(hint)) is not None)
+    required_keys = tuple(sorted(cls.__required_keys__)) if required else ()
+
+    if not converters and not type_checks and not required_keys:
+        return None
+
+    def check(data: Mapping[str, Any]) -> Mapping[str, Any]:
+        if required_keys and (missing := [key for key in required_keys if key not in data]):
+            raise ValueError(f"{cls.__name__} is missing required keys: {', '.join(missing)}")
+
+        for (key, primitive, allowed_types) in type_checks:
+            if (value := data.get(key)) is None:
+                continue
+
+            # bool is a subclass of int, but True isn't a valid count or amount.
+            if not isinstance(value, allowed_types) or (type(value) is bool and primitive is not bool):
+                raise TypeError(f"{key}: {value!r} is not a valid {primitive.__name__}")
+
+            # orjson would send NaN and infinite floats as null, and the json module refuses to encode them.
+            if primitive is float and not math.isfinite(value):
+                raise ValueError(f"{key}: {value!r} is not a finite number")
+
+        return _convert_fields(data, converters)
+
+    return check
+
+class HttpxResponse:
+    '''
+    Wrap an `httpx.Response` with the parts of the Requests response interface used by this package.
+
+    Attributes:
+        response: The underlying `httpx` response.
     '''
 
-    # FIXME: path and query should be cleaned/validated to ensure that they can form a valid URL.
+    def __init__(self, response):
+        self.response = response
+
+    @property
+    def ok(self) -> bool:
+        return self.response.status_code < 400
+
+    @property
+    def status_code(self) -> int:
+        return self.response.status_code
+
+    @property
+    def headers(self):
+        return self.response.headers
+
+    @property
+    def content(self) -> bytes:
+        return self.response.content
+
+    @functools.cached_property
+    def raw(self) -> io.BytesIO:
+        # The body has already been read (and decoded) by httpx, so expose it as a file object. It is created
+        # once, so that attributes set on it (e.g. `decode_content`) and its read position persist.
+        return io.BytesIO(self.response.content)
+
+    def json(self, **kwargs) -> Any:
+        return self.response.json(**kwargs)
 
-    match query:
-        case str():
-            return f"{BASE_URL}/api/{version}{path}?{query}"
-        case { **queries }:
-            return f"{BASE_URL}/api/{version}{path}?{to_query_str(queries)}"
-        case _:
-            return f"{BASE_URL}/api/{version}{path}"
+    def close(self):
+        self.response.close()
 
-def create_session(api_key: str, set_current_session: bool = True) -> Session:
+class HttpxSession:
+    '''
+    Wrap an `httpx.Client` so that it can be used in place of a Requests session.
+
+    Only the arguments to `session.request()` used by this package are translated (`data`, `headers`,
+    `timeout`, `allow_redirects` and `stream`), other arguments are passed to `httpx.Client.request()` as-is.
+    Streaming isn't supported, so the response body is always read in full before it is parsed, even by
+    `assignments.list_all_iter()` and `project.list_all(stream_items=True)`.
+
+    Attributes:
+        client: The underlying `httpx` client.
+    '''
+
+    def __init__(self, client):
+        self.client = client
+
+    @property
+    def headers(self):
+        return self.client.headers
+
+    def request(self, method: str, url: str, data: Any = None, stream: bool = False, allow_redirects: bool = True,
+                **kwargs) -> HttpxResponse:
+        if isinstance(data, (bytes, str)):
+            kwargs['content'] = data
+        elif data is not None:
+            kwargs['data'] = data
+
+        return HttpxResponse(self.client.request(method, url, follow_redirects=allow_redirects, **kwargs))
+
+    def close(self):
+        self.client.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+def _create_httpx_session(api_key: str) -> HttpxSession:
+    import httpx
+
+    return HttpxSession(httpx.Client(
+        http2=True,
+        headers={ 'X-API-KEY': api_key, 'Accept': 'application/json', 'Accept-Encoding': ACCEPT_ENCODING },
+        limits=httpx.Limits(max_keepalive_connections=POOL_MAXSIZE // 2, max_connections=POOL_MAXSIZE),
+        timeout=DEFAULT_TIMEOUT,
+    ))
+
+class _TimeoutAdapter(HTTPAdapter):
+    # Applies DEFAULT_TIMEOUT to requests sent without a timeout, without touching the arguments of each call.
+    # Requests passes None both when no timeout was given and for an explicit None, so (None, None) disables it.
+    @override
+    def send(self, request, stream=False, timeout=None, verify=True, cert=None, proxies=None):
+        return super().send(request, stream=stream, timeout=DEFAULT_TIMEOUT if timeout is None else timeout,
+                            verify=verify, cert=cert, proxies=proxies)
+
+def create_session(api_key: str, set_current_session: bool = True,
+                   backend: Literal['requests', 'httpx'] = 'requests') -> Session | HttpxSession:
     '''
     Create a new Requests session that uses an api key for all subsequent requests.
     
     Each API call must be associated with a valid API key. A session allows one to save
-    the key and have it persist across multiple requests.
+    the key and have it persist across multiple requests. Connections to the API are kept
+    alive and pooled, transient errors are retried according to `MAX_RETRIES` and requests
+    time out after `DEFAULT_TIMEOUT` seconds unless a `timeout` argument is given. Since Requests
+    passes `timeout=None` when no timeout is given, use `timeout=(None, None)` to wait indefinitely.
 
     Args:
         api_key: The CloudResearch Connect API key.
-        set_current_session: If `True` the current session will be replaced with the newly created one.
+        set_current_session: If `True` the current session (for the calling thread or context, and
+        the process-wide default) will be replaced with the newly created one.
+        backend: `requests` (the default) or `httpx`. The `httpx` backend multiplexes concurrent
+        requests over HTTP/2 and requires `httpx[http2]` to be installed.
     
     Returns:
-        A Requests session.
+        A Requests session, or an `HttpxSession` wrapping an `httpx.Client` if `backend='httpx'`.
     '''
 
-    # FIXME: This isn't thread-safe
-
     global CURRENT_SESSION
 
+    if backend == 'httpx':
+        s = _create_httpx_session(api_key)
+
+        if set_current_session:
+            _current_session.set(s)
+            CURRENT_SESSION = s
+
+        return s
+
     s = requests.session()
     s.headers['X-API-KEY'] = api_key
+    s.headers.update({
+        'Accept': 'application/json',
+        'Accept-Encoding': ACCEPT_ENCODING,
+        'Connection': 'keep-alive',
+    })
+    adapter = _TimeoutAdapter(pool_connections=POOL_CONNECTIONS, pool_maxsize=POOL_MAXSIZE, max_retries=MAX_RETRIES)
+    s.mount('https://', adapter)
+    s.mount('http://', adapter)
     
     if set_current_session:
+        _current_session.set(s)
         CURRENT_SESSION = s
     
     return s
 
+def get_current_session() -> HttpClient:
+    '''
+    Get the session used by API calls that aren't passed a session explicitly.
+
+    This is the most recent session created by `create_session()` in the calling thread or context,
+    or failing that, the most recent one created anywhere in the process.
+
+    Returns:
+        A Requests session.
+
+    Raises:
+        SessionException: `create_session()` was not called.
+    '''
+
+    session = _current_session.get()
+
+    if session is None:
+        session = CURRENT_SESSION
+
+        if session is None:
+            raise SessionException("No session has been supplied. Either use create_session() or a Requests Session object.")
+
+    return session
+
 def request(method: str, path: str, query: Optional[str | Mapping[Any, Any]] = None,
             json_response: bool = True, return_response: bool = False, idempotency_token: Optional[str] = None,
-            session: Optional[Session] = None, **kwargs) -> Any:
+            session: Optional[HttpClient] = None, parse_decimal: bool = False, discard_response: bool = False,
+            **kwargs) -> Any:
     '''
     Perform an API request and return the JSON response as a `dict`.
     
@@ -135,11 +538,14 @@ def request(method: str, path: str, query: Optional[str | Mapping[Any, Any]] = N
         return_response: Return the Requests response itself instead of the content body.
         idempotency_token: A string used to identify this particular request to prevent duplicates.
         session: The current Requests session. If `None`, then the most recent session created by `create_session()` is used.
+        parse_decimal: Parse JSON numbers with a fractional part as `Decimal` instead of `float` (e.g. for monetary amounts).
+        discard_response: Close the response and return `None` for endpoints whose response body isn't needed.
         kwargs: Additional arguments to be passed to `session.request()`.
     
     Returns:
         If `return_response = True`, a Requests response (regardless of the value of `json_response`).
-        If `return_response = False`, the content of response as a JSON parsed `dict`
+        If `discard_response = True`, `None`.
+        Otherwise, the content of response as a JSON parsed `dict`
         if `json_response` is `True`, otherwise a sequence of `bytes`.
     
     Raises:
@@ -148,29 +554,53 @@ def request(method: str, path: str, query: Optional[str | Mapping[Any, Any]] = N
     '''
 
     if session is None:
-        if CURRENT_SESSION is None:
-            raise SessionException("No session has been supplied. Either use create_session() or a Requests Session object.")
-        else:
-            session = CURRENT_SESSION
-
-    response = session.request(
-        headers=({ 'IDEMPOTENCY-TOKEN': idempotency_token } if idempotency_token is not None else {}),
-        method=method,
-        url=endpoint_url(path, query=query),
-        **kwargs,
-        )
-    
-    if response.ok:
-        if return_response:
-            return response
-        elif json_response:
-            return response.json()
-        else:
-            return response.content
+        session = get_current_session()
+
+    _prepare_request(idempotency_token, kwargs)
+
+    url = endpoint_url(path, query=query)
+    response = session.request(method=method, url=url, **kwargs)
+
+    return _handle_response(response, json_response, return_response, parse_decimal, discard_response)
+
+def _prepare_request(idempotency_token: Optional[str], kwargs: dict[str, Any]):
+    # Shared headers live on the session; only send per-request headers when there are any.
+    headers = kwargs.pop('headers', None)
+
+    if idempotency_token is not None:
+        headers = { 'IDEMPOTENCY-TOKEN': idempotency_token, **headers } if headers else { 'IDEMPOTENCY-TOKEN': idempotency_token }
+
+    # Encode JSON bodies here so that orjson is used when it's installed.
+    if (payload := kwargs.pop('json', None)) is not None:
+        kwargs['data'] = _json_dumps(payload)
+        headers = { 'Content-Type': 'application/json', **headers } if headers else { 'Content-Type': 'application/json' }
+
+    if headers:
+        kwargs['headers'] = headers
+
+def _handle_response(response: requests.Response, json_response: bool, return_response: bool,
+                     parse_decimal: bool, discard_response: bool) -> Any:
+    # Equivalent to `not response.ok`, without going through raise_for_status().
+    if (status_code := response.status_code) >= 400:
+        try:
+            data = _json_loads(response.content)
+        except ValueError:
+            # e.g. an HTML or empty body from a proxy or load balancer.
+            data = None
+
+        raise ApiError(status_code, data)
+
+    if return_response:
+        return response
+    elif discard_response:
+        response.close()
+        return None
+    elif json_response:
+        return _json_loads_decimal(response.content) if parse_decimal else _json_loads(response.content)
     else:
-        raise ApiError(response.status_code, response.json())
+        return response.content
 
-def get(path: str, query: Optional[str | dict[Any, Any]] = None, session: Optional[Session] = None,
+def get(path: str, query: Optional[str | dict[Any, Any]] = None, session: Optional[HttpClient] = None,
         json_response: bool = True, return_response: bool = False, **kwargs) -> Any:
     '''
     Perform a GET request and return the content of the response.
@@ -194,7 +624,153 @@ def get(path: str, query: Optional[str | dict[Any, Any]] = None, session: Option
     return request('GET', path, query, json_response=json_response, return_response=return_response,
                    session=session, **kwargs)
 
-def post(path: str, query: Optional[str | dict[Any, Any]] = None, session: Optional[Session] = None,
+def stream_get(path: str, query: Optional[str | dict[Any, Any]] = None, session: Optional[HttpClient] = None,
+               **kwargs) -> requests.Response:
+    '''
+    Perform a GET request without reading the response body up front.
+
+    The body can then be consumed incrementally from `response.raw` or `response.iter_content()`.
+    The caller is responsible for closing the response so its connection is returned to the pool.
+
+    Args:
+        path: The endpoint path (not including the base url).
+        query: An optional url query. It may be a query string or a `dict` of key/value pairs.
+        session: The current Requests session. If `None`, then the most recent session created by `create_session()` is used.
+        kwargs: Additional arguments to be passed to `session.request()`.
+
+    Returns:
+        A Requests response whose content has not been read yet.
+
+    Raises:
+        ApiError: A 4xx or 5xx HTTP response was received along with error information.
+    '''
+
+    return request('GET', path, query, return_response=True, session=session, stream=True, **kwargs)
+
+# Arguments of `request()` that change what is returned, so a cached `dict` can't be used in their place.
+_RESPONSE_KWARGS = frozenset(['json_response', 'return_response', 'discard_response', 'parse_decimal', 'stream'])
+
+def cached_get(path: str, ttl: float, query: Optional[str | dict[Any, Any]] = None, session: Optional[HttpClient] = None,
+               stale_ttl: float = 0, **kwargs) -> Any:
+    '''
+    Perform a GET request, reusing the previous response if it was fetched within the last `ttl` seconds.
+
+    Responses are cached in-process per API key and URL. Once an entry is older than `ttl`, the request
+    is sent again, with an `If-None-Match` header if the server returned an `ETag`, so that an unchanged
+    response (`304 Not Modified`) only refreshes the cached entry.
+
+    If `stale_ttl` is given and the request fails with a transient error (a connection error, a timeout,
+    `429 Too Many Requests` or a 5xx response), a cached response fetched within the last `stale_ttl`
+    seconds is returned instead, and a warning is logged.
+
+    Requests with any of `json_response`, `return_response`, `discard_response`, `parse_decimal` or `stream`
+    bypass the cache and are returned as `request()` would return them.
+
+    Note: The same JSON parsed `dict` is returned to every caller and should not be modified.
+
+    Args:
+        path: The endpoint path (not including the base url).
+        ttl: How long, in seconds, a cached response may be reused without contacting the server.
+        query: An optional url query. It may be a query string or a `dict` of key/value pairs.
+        session: The current Requests session. If `None`, then the most recent session created by `create_session()` is used.
+        stale_ttl: How old, in seconds, a cached response returned in place of a transient error may be.
+        kwargs: Additional arguments to be passed to `session.request()`.
+
+    Returns:
+        The content of response as a JSON parsed `dict`.
+
+    Raises:
+        ApiError: A 4xx or 5xx HTTP response was received along with error information.
+    '''
+
+    if session is None:
+        session = get_current_session()
+
+    if not _RESPONSE_KWARGS.isdisjoint(kwargs):
+        # The caller wants the response in a form other than the parsed JSON that is cached.
+        return request('GET', path, query, session=session, **kwargs)
+
+    key = (session.headers.get('X-API-KEY', ''), endpoint_url(path, query=query))
+    entry = _cache.get(key)
+    now = time.monotonic()
+
+    if entry is not None:
+        (fetched_at, value, etag, _) = entry
+
+        if now - fetched_at < ttl:
+            _store(key, entry)
+            return value
+
+        if etag is not None:
+            kwargs['headers'] = { 'If-None-Match': etag, **(kwargs.get('headers') or {}) }
+
+    try:
+        response = request('GET', path, query, return_response=True, session=session, **kwargs)
+    except Exception as e:
+        if entry is None or now - entry[0] >= stale_ttl or not _is_transient_error(e):
+            raise
+
+        _logger.warning("GET %s failed (%r); returning the response cached %.0f seconds ago", key[1], e, now - entry[0])
+        return entry[1]
+
+    # Without an ETag, an entry is of no use once it is too old to be returned, even in place of an error.
+    usable_until = now + max(ttl, stale_ttl)
+
+    if response.status_code == 304 and entry is not None:
+        _store(key, (now, entry[1], entry[2], usable_until))
+        return entry[1]
+
+    value = _json_loads(response.content)
+    _store(key, (now, value, response.headers.get('ETag'), usable_until))
+
+    return value
+
+def _is_transient_error(e: Exception) -> bool:
+    if isinstance(e, ApiError):
+        return e.status_code == 429 or e.status_code >= 500
+    elif isinstance(e, (requests.ConnectionError, requests.Timeout)):
+        return True
+
+    # httpx is only imported by sessions created with backend='httpx'.
+    httpx = sys.modules.get('httpx')
+    return httpx is not None and isinstance(e, httpx.TransportError)
+
+def _store(key: tuple[str, str], entry: tuple[float, Any, Optional[str], float]):
+    # (Re)inserts the entry as the most recently used, then evicts entries that are unusable or over the limit.
+    with _cache_lock:
+        _cache.pop(key, None)
+        _cache[key] = entry
+
+        if len(_cache) > CACHE_MAXSIZE:
+            now = entry[0]
+
+            for k in [k for (k, e) in _cache.items() if e[2] is None and e[3] <= now]:
+                del _cache[k]
+
+            while len(_cache) > CACHE_MAXSIZE:
+                del _cache[next(iter(_cache))]
+
+def invalidate_cache(path: Optional[str] = None):
+    '''
+    Remove responses cached by `cached_get()`.
+
+    Args:
+        path: The endpoint path (not including the base url) whose responses (with any query, and those of
+        any paths below it) should be removed. If `None`, the whole cache is cleared.
+    '''
+
+    with _cache_lock:
+        if path is None:
+            _cache.clear()
+            return
+
+        url = endpoint_url(path)
+        prefixes = (url + '?', url + '/')
+
+        for key in [k for k in _cache if k[1] == url or k[1].startswith(prefixes)]:
+            del _cache[key]
+
+def post(path: str, query: Optional[str | dict[Any, Any]] = None, session: Optional[HttpClient] = None,
          idempotency_token: Optional[str] = None, json_response: bool = True, return_response: bool = False, **kwargs) -> Any:
     '''
     Perform a POST request and return the content of the response.
@@ -219,7 +795,7 @@ def post(path: str, query: Optional[str | dict[Any, Any]] = None, session: Optio
                    json_response=json_response, return_response=return_response, session=session,
                    **kwargs)
 
-def delete(path: str, query: Optional[str | dict[Any, Any]] = None, session: Optional[Session] = None,
+def delete(path: str, query: Optional[str | dict[Any, Any]] = None, session: Optional[HttpClient] = None,
            idempotency_token: Optional[str] = None, json_response: bool = True, return_response: bool = False, **kwargs) -> Any:
     '''
     Perform a DELETE request and return the content of the response.
@@ -244,7 +820,7 @@ def delete(path: str, query: Optional[str | dict[Any, Any]] = None, session: Opt
                    json_response=json_response, return_response=return_response, session=session,
                    **kwargs)
 
-def put(path: str, query: Optional[str | dict[Any, Any]] = None, session: Optional[Session] = None,
+def put(path: str, query: Optional[str | dict[Any, Any]] = None, session: Optional[HttpClient] = None,
         idempotency_token: Optional[str] = None, json_response: bool = True, return_response: bool = False, **kwargs) -> Any:
     '''
     Perform a PUT request and return the content of the response.
@@ -269,7 +845,7 @@ def put(path: str, query: Optional[str | dict[Any, Any]] = None, session: Option
                    json_response=json_response, return_response=return_response, session=session,
                    **kwargs)
 
-def patch(path: str, query: Optional[str | dict[Any, Any]] = None, session: Optional[Session] = None,
+def patch(path: str, query: Optional[str | dict[Any, Any]] = None, session: Optional[HttpClient] = None,
           idempotency_token: Optional[str] = None, json_response: bool = True, return_response: bool = False, **kwargs) -> Any:
     '''
     Perform a PATCH request and return the content of the response.
@@ -293,3 +869,86 @@ def patch(path: str, query: Optional[str | dict[Any, Any]] = None, session: Opti
     return request('PATCH', path, query, idempotency_token=idempotency_token,
                    json_response=json_response, return_response=return_response, session=session,
                    **kwargs)
+
+CURRENT_ASYNC_SESSION = None
+'''The default `httpx.AsyncClient` used by the `*_async` functions, set by `create_async_session()`.'''
+
+def create_async_session(api_key: str, set_current_session: bool = True):
+    '''
+    Create a new `httpx.AsyncClient` that uses an api key for all subsequent requests made by the `*_async` functions.
+
+    The client multiplexes concurrent requests over HTTP/2, so many calls can be awaited together
+    (e.g. with `asyncio.gather()`) over a single connection. Requires `httpx[http2]` to be installed.
+
+    Args:
+        api_key: The CloudResearch Connect API key.
+        set_current_session: If `True` the current async session will be replaced with the newly created one.
+
+    Returns:
+        An `httpx.AsyncClient`.
+    '''
+
+    import httpx
+
+    global CURRENT_ASYNC_SESSION
+
+    client = httpx.AsyncClient(
+        http2=True,
+        headers={ 'X-API-KEY': api_key, 'Accept': 'application/json', 'Accept-Encoding': ACCEPT_ENCODING },
+        limits=httpx.Limits(max_keepalive_connections=20),
+        timeout=DEFAULT_TIMEOUT,
+    )
+
+    if set_current_session:
+        CURRENT_ASYNC_SESSION = client
+
+    return client
+
+async def request_async(method: str, path: str, query: Optional[str | Mapping[Any, Any]] = None,
+                        json_response: bool = True, return_response: bool = False, idempotency_token: Optional[str] = None,
+                        session: Any = None, parse_decimal: bool = False, discard_response: bool = False, **kwargs) -> Any:
+    '''
+    Perform an API request with an `httpx.AsyncClient` and return the JSON response as a `dict`.
+
+    This is the asynchronous counterpart of `request()` and accepts the same arguments, except that `session`
+    is an `httpx.AsyncClient` and `kwargs` are passed to `httpx.AsyncClient.request()`.
+
+    Args:
+        method: The HTTP verb (e.g. GET, POST, PUT, etc.)
+        path: The endpoint path (not including the base url).
+        query: An optional url query. It may be a query string or a `dict` of key/value pairs.
+        json_response: Return the response as a JSON `dict` if True, otherwise return `bytes`.
+        return_response: Return the `httpx` response itself instead of the content body.
+        idempotency_token: A string used to identify this particular request to prevent duplicates.
+        session: The async client. If `None`, then the most recent client created by `create_async_session()` is used.
+        parse_decimal: Parse JSON numbers with a fractional part as `Decimal` instead of `float` (e.g. for monetary amounts).
+        discard_response: Close the response and return `None` for endpoints whose response body isn't needed.
+        kwargs: Additional arguments to be passed to `session.request()`.
+
+    Returns:
+        The same as `request()`.
+
+    Raises:
+        SessionException: `session=None` and `create_async_session()` was not called.
+        ApiError: A 4xx or 5xx HTTP response was received along with error information.
+    '''
+
+    if session is None:
+        session = CURRENT_ASYNC_SESSION
+
+        if session is None:
+            raise SessionException("No async session has been supplied. Either use create_async_session() or an httpx AsyncClient object.")
+
+    _prepare_request(idempotency_token, kwargs)
+
+    if 'data' in kwargs:
+        kwargs['content'] = kwargs.pop('data')
+
+    response = await session.request(method, endpoint_url(path, query=query), **kwargs)
+
+    if discard_response and not return_response and response.status_code < 400:
+        # An async response has to be closed asynchronously.
+        await response.aclose()
+        return None
+
+    return _handle_response(response, json_response, return_response, parse_decimal, False)
@@ -1,10 +1,12 @@
 # -*- coding: utf-8 -*-
 
-from typing import Optional, TypedDict
-from requests import Session
-from strenum import PascalCaseStrEnum
+from typing import Literal, Optional
+from typing_extensions import TypedDict
 from . import base
-from enum import auto
+from .base import HttpClient
+
+CACHE_TTL = 3600
+"""How long, in seconds, the demographics list is reused before it is requested again."""
 
 class Range(TypedDict):
     lower: int
@@ -26,17 +28,18 @@ class DemographicQuota(TypedDict, total=False):
     target: int
     """How many participants are being targeted for this demographic requirement."""
 
-class TargetOption(PascalCaseStrEnum):
-    GENERAL_POPULATION = 'GenPop'
-    """Open to everyone without any targeting criteria."""
+TargetOption = Literal['GenPop', 'GenderSplit', 'CensusMatched', 'Custom']
 
-    GENDER_SPLIT = auto()
-    """Targets a breakdown between gender."""
+GENERAL_POPULATION: TargetOption = 'GenPop'
+"""Open to everyone without any targeting criteria."""
 
-    CENSUS_MATCHED = auto()
-    """Target a Census matched template."""
-    
-    CUSTOM = auto()
+GENDER_SPLIT: TargetOption = 'GenderSplit'
+"""Targets a breakdown between gender."""
+
+CENSUS_MATCHED: TargetOption = 'CensusMatched'
+"""Target a Census matched template."""
+
+CUSTOM: TargetOption = 'Custom'
 
 class DemographicRequirements(TypedDict, total=False):
     quotas: Optional[list[DemographicQuota]]
@@ -105,9 +108,10 @@ class FeasibilityRequest(TypedDict, total=False):
     targetingCriteria: Optional[DemographicTargeting]
     """Custom criteria for targeting participants."""
 
-class Platform(PascalCaseStrEnum):
-    CONNECT = auto()
-    MANAGED_RESEARCH = auto()
+Platform = Literal['Connect', 'ManagedResearch']
+
+CONNECT: Platform = 'Connect'
+MANAGED_RESEARCH: Platform = 'ManagedResearch'
 
 class FeasibilityResponse(TypedDict):
     totalProjectCost: float
@@ -116,9 +120,12 @@ class FeasibilityResponse(TypedDict):
     availablePlatforms: Optional[list[Platform]]
 
 
-def list_all(session: Optional[Session] = None, **kwargs) -> DemographicsResponse:
+def list_all(session: Optional[HttpClient] = None, **kwargs) -> DemographicsResponse:
     """
     List the demographics that you can use for targeting criteria.
+
+    The list rarely changes, so it is cached for `CACHE_TTL` seconds (per API key). Use `invalidate_cache()`
+    to force it to be requested again. The returned `dict` is shared and should not be modified.
     
     Args:
         session: The current Requests session. If `None`, use the last session that was created
@@ -134,9 +141,13 @@ def list_all(session: Optional[Session] = None, **kwargs) -> DemographicsRespons
             401 - Invalid API or unauthorized resource access.
 
     """
-    return base.get("/demographics/list", session, **kwargs)
+    return base.cached_get("/demographics/list", CACHE_TTL, session=session, **kwargs)
+
+def invalidate_cache():
+    """Remove the cached demographics list so that the next call to `list_all()` requests it again."""
+    base.invalidate_cache("/demographics/list")
 
-def calc_feasibility(data: FeasibilityRequest, session: Optional[Session] = None, idempotency_token: Optional[str] = None, **kwargs) -> FeasibilityResponse:
+def calc_feasibility(data: FeasibilityRequest, session: Optional[HttpClient] = None, idempotency_token: Optional[str] = None, **kwargs) -> FeasibilityResponse:
     """
     Calculate the feasibility for a project.
     
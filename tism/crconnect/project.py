@@ -1,13 +1,31 @@
 # -*- coding: utf-8 -*-
 
-from requests import Session
-from typing import TypedDict, Optional
+from typing import Optional, Any
 from strenum import PascalCaseStrEnum, StrEnum
 from enum import auto
-from typing_extensions import Required
-from collections.abc import Generator
+from typing_extensions import Required, TypedDict
+from collections.abc import AsyncIterator, Generator, Iterator, Sequence
+from dataclasses import dataclass, fields
+from concurrent.futures import ThreadPoolExecutor
+import functools
+from urllib.parse import parse_qsl
 from . demographics import DemographicTargeting
 from . import base
+from .base import HttpClient
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+RETRIEVE_CACHE_TTL = 10
+"""How long, in seconds, a project returned by `retrieve()` is reused before it is requested again."""
+
+STATISTICS_CACHE_TTL = 5
+"""How long, in seconds, statistics returned by `retrieve_statistics()` are reused before they are requested again."""
+
+STATISTICS_STALE_TTL = 300
+"""How old, in seconds, statistics returned by `retrieve_statistics()` may be when the API fails with a transient error."""
 
 class SystemRequirement(PascalCaseStrEnum):
     AUDIO = auto()
@@ -84,7 +102,7 @@ class DataLabelingSettings(TypedDict):
     dataLabelingSelectOptions: list[DataLabelingSelectOptions]
     """Choice options that the participant can select from. Only valid for `SelectOne` and `SelectAll` `dataLabelingResponseMethod`."""
 
-class TemplateSettings:
+class TemplateSettings(TypedDict, total=False):
     htmlTemplateMarkup: Optional[str]
     """The html template markup. Should only be set if the template type is `CustomHtml`."""
 
@@ -172,6 +190,45 @@ class ProjectResponseData(ProjectData):
     createdAt: str
     """The UTC time the Project was created at."""
 
+@dataclass(slots=True, frozen=True)
+class ProjectResponseRecord:
+    """
+    A compact, immutable alternative to `ProjectResponseData` for holding large numbers of projects in memory.
+
+    Unlike a `dict`, each record stores its fields in fixed slots, which uses considerably less memory.
+    """
+
+    projectId: Optional[str]
+    name: str
+    projectUrl: Optional[str]
+    payment: float
+    estimatedTimeInMinutes: int
+    participants: int
+    summary: Optional[str]
+    instructions: Optional[str]
+    internalName: Optional[str]
+    systemRequirements: Optional[list[SystemRequirement]]
+    hasSensitiveContent: bool
+    deviceRequirements: Optional[list[DeviceType]]
+    completionSettings: CompletionSettings
+    maxTimeInMinutes: Optional[int]
+    demographicTargeting: Optional[DemographicTargeting]
+    platformTargeting: Optional[PlatformTargeting]
+    taskTemplate: Optional[TaskTemplate]
+    totalCost: float
+    createdAt: str
+
+    @classmethod
+    def from_dict(cls, data: ProjectResponseData) -> 'ProjectResponseRecord':
+        """Create a record from a project returned by the API (unknown keys are ignored)."""
+        return cls(*[data.get(name) for name in _RECORD_FIELDS])
+
+    def to_dict(self) -> ProjectResponseData:
+        """Convert the record back into a `ProjectResponseData` dict."""
+        return { name: getattr(self, name) for name in _RECORD_FIELDS }
+
+_RECORD_FIELDS = tuple(f.name for f in fields(ProjectResponseRecord))
+
 class ProjectResponse(TypedDict):
     project: Optional[ProjectResponseData]
 
@@ -225,6 +282,56 @@ class ProjectStatistics(TypedDict):
     medianDuration: float
     """Median time duration in minutes of completed assignments."""
 
+_check_project_data = base.compile_checker(ProjectData)
+_check_new_project_data = base.compile_checker(ProjectData, required=True)
+
+_STATUS_STRS = base.freeze_enum(ProjectStatus)
+
+# There are only a handful of statuses, so their request bodies are encoded once rather than on every call.
+_STATUS_PAYLOADS = { status: base._json_dumps({ 'status': value }) for (status, value) in _STATUS_STRS.items() }
+_JSON_HEADERS = { 'Content-Type': 'application/json' }
+
+# Build (and intern) the value tables of every request enum at import time rather than on first use.
+for _enum in (SystemRequirement, DeviceType, ProjectCompletionType, TaskTemplateType, DataLabelingResponseMethod,
+              Location, Language):
+    base.freeze_enum(_enum)
+
+del _enum
+
+class ProjectRef:
+    """
+    A project ID along with its endpoint paths, which are built once rather than on every call.
+
+    A `ProjectRef` can be passed as the `project_id` of `retrieve()`, `edit()`, `update_status()`,
+    `retrieve_statistics()` and `invalidate_cache()`.
+
+    Attributes:
+        project_id: The project ID.
+        path: The project's endpoint path.
+        statistics_path: The endpoint path of the project's statistics.
+        status_path: The endpoint path for updating the project's status.
+    """
+
+    __slots__ = ('project_id', 'path', 'statistics_path', 'status_path')
+
+    def __init__(self, project_id: str):
+        self.project_id = project_id
+        self.path = f"/project/{project_id}"
+        self.statistics_path = self.path + "/statistics"
+        self.status_path = self.path + "/update-status"
+
+    def __str__(self) -> str:
+        return self.project_id
+
+    def __repr__(self) -> str:
+        return f"ProjectRef({self.project_id!r})"
+
+# Shared by every page without any projects, rather than allocating a new empty list for each one.
+_EMPTY: tuple = ()
+
+def _page_query(base_query: dict, token: Optional[str]) -> Optional[dict]:
+    return (base_query or None) if token is None else { **base_query, 'NextToken': token }
+
 class Paginator:
     '''
     A paginator iterates through long lists of results. Each list is sliced into pages of
@@ -236,46 +343,147 @@ class Paginator:
         session: The current Requests session. If `None`, then the most recent session created by `create_session()` is used.
         path: The endpoint path (not including the base url).
         query: An optional url query. It may be a query string or a `dict` of key value pairs.
+        prefetch: If `True`, the next page is requested in a background thread while the current page is being iterated.
+        An iteration stopped early may then send one more page request than it uses.
+        as_record: If `True`, projects are returned as `ProjectResponseRecord`s instead of `dict`s.
+        stream_items: If `True` (and `ijson` is installed), projects are parsed and returned as each page is downloaded.
         kwargs: Additional arguments to pass to the underlying `request()` function.
     '''
-    def __init__(self, path: str, query: Optional[str | FilterQuery] = None, session: Optional[Session] = None, **kwargs):
+    def __init__(self, path: str, query: Optional[str | FilterQuery] = None, session: Optional[HttpClient] = None,
+                 prefetch: bool = False, as_record: bool = False, stream_items: bool = False, **kwargs):
         '''
         Args:
             session: The current Requests session. If `None`, then the most recent session created by `create_session()` is used.
             path: The endpoint path (not including the base url).
             query: An optional url query. It may be a query string or a `dict` of key value pairs.
+            prefetch: Request the next page in a background thread while the current page is being iterated.
+            Off by default, since stopping early (e.g. after the first page) then still requests the next page.
+            as_record: Return projects as `ProjectResponseRecord`s instead of `dict`s.
+            stream_items: When iterating over projects, parse and return them as each page is downloaded
+            (requires `ijson`, otherwise this is ignored). Pages aren't prefetched in this mode.
             kwargs: Additional arguments to pass to the underlying `request()` function.
         '''
         self.path = path
         self.query = query
         self.session = session
+        self.prefetch = prefetch
+        self.as_record = as_record
+        self.stream_items = stream_items
         self.kwargs = kwargs
     
     def __iter__(self) -> Generator[None, ProjectResponseData, None]:
-        match self.query:
-            case dict():
-                query = self.query.copy()
-            case str():
-                query = dict([(q.split('=', maxsplit=2)+[None])[:2] for q in query.split('&')])
-            case None:
-                query = None
+        if self.stream_items and ijson is not None:
+            yield from self._iter_streamed()
+        else:
+            for page in self.iter_pages():
+                yield from page
+
+    def _base_query(self) -> dict:
+        # Called once per iteration. The filter itself is never modified, so the paginator can be iterated more than once.
+        query = self.query
+
+        if query is None:
+            return {}
+        elif isinstance(query, str):
+            return dict(parse_qsl(query, keep_blank_values=True))
+        elif isinstance(query, dict):
+            return query
+        else:
+            raise TypeError(f"query must be a str or a dict, not {type(query).__name__}")
+
+    def _iter_streamed(self) -> Iterator[ProjectResponseData | ProjectResponseRecord]:
+        base_query = self._base_query()
+        session = self.session if self.session is not None else base.get_current_session()
+        path = self.path
+        kwargs = self.kwargs
+        convert = ProjectResponseRecord.from_dict if self.as_record else None
+        token = None
 
         while True:
-            current_page = base.get(self.path, query=query, session=self.session, **self.kwargs)
+            response = base.stream_get(path, query=_page_query(base_query, token), session=session, **kwargs)
+            token = None
+
+            try:
+                # Parse the page as it arrives, building each project as soon as it is complete.
+                response.raw.decode_content = True
+                builder = None
+
+                for (prefix, event, value) in ijson.parse(response.raw, use_float=True):
+                    if builder is not None:
+                        builder.event(event, value)
+
+                        if prefix == 'projects.item' and event in ('end_map', 'end_array'):
+                            yield convert(builder.value) if convert is not None else builder.value
+                            builder = None
+                    elif prefix == 'projects.item':
+                        if event in ('start_map', 'start_array'):
+                            builder = ijson.ObjectBuilder()
+                            builder.event(event, value)
+                        else:
+                            # Converted like any other item, as iter_pages() does.
+                            yield convert(value) if convert is not None else value
+                    elif prefix == 'nextToken':
+                        token = value
+            finally:
+                response.close()
+
+            if token is None:
+                break
 
-            for x in current_page.get('projects', []):
-                yield x
+    def iter_pages(self) -> Iterator[Sequence[ProjectResponseData] | list[ProjectResponseRecord]]:
+        '''
+        Iterate through the results a page at a time.
 
-            match query:
-                case None | str():
-                    query  = { 'NextToken': current_page.get('nextToken', None) }
-                case _:
-                    query['NextToken'] = current_page.get('nextToken', None)
+        Returns:
+            An iterator over the lists of projects in each page. Unless `as_record` is set, a page without any projects is an empty `tuple`.
+        '''
 
-            if query['NextToken'] is None:
-                break
+        base_query = self._base_query()
+
+        # Resolve the default session (and the request arguments) once, rather than on every page, so
+        # that every page is fetched over the same pooled connections.
+        session = self.session if self.session is not None else base.get_current_session()
+        path = self.path
+        kwargs = self.kwargs
+        as_record = self.as_record
+        from_dict = ProjectResponseRecord.from_dict
 
-def create(project_data: ProjectData, session: Optional[Session]=None, idempotency_token: Optional[str]=None, **kwargs) -> ProjectResponse:
+        def fetch(token):
+            return base.get(path, query=_page_query(base_query, token), session=session, **kwargs)
+
+        # With prefetching, the next page is requested in the background while the current one is consumed.
+        executor = ThreadPoolExecutor(max_workers=1) if self.prefetch else None
+
+        try:
+            current_page = fetch(None)
+
+            while True:
+                token = current_page.get('nextToken')
+
+                if token is None:
+                    next_page = None
+                elif executor is not None:
+                    next_page = executor.submit(fetch, token).result
+                else:
+                    next_page = functools.partial(fetch, token)
+
+                projects = current_page.get('projects') or _EMPTY
+
+                if as_record:
+                    yield [from_dict(x) for x in projects]
+                else:
+                    yield projects
+
+                if next_page is None:
+                    break
+
+                current_page = next_page()
+        finally:
+            if executor is not None:
+                # Don't make an abandoned iteration wait for a page that will never be used.
+                executor.shutdown(wait=False, cancel_futures=True)
+
+def create(project_data: ProjectData, session: Optional[HttpClient]=None, idempotency_token: Optional[str]=None, **kwargs) -> ProjectResponse:
     """
     Create a project.
     
@@ -293,13 +501,15 @@ def create(project_data: ProjectData, session: Optional[Session]=None, idempoten
         The newly created project structure along with additional status information.
     
     Raises:
+        ValueError: A required field is missing, or a field has a value that isn't valid for its enum (e.g. `deviceRequirements`).
+        TypeError: A `str`, `int`, `float` or `bool` field has a value of another type.
         ApiError:
             400 - Bad Request.
             401 - Invalid API or unauthorized resource access.
     """
-    return base.post("/project", json=project_data, idempotency_token=idempotency_token, session=session, **kwargs)
+    return base.post("/project", json=_check_new_project_data(project_data), idempotency_token=idempotency_token, session=session, **kwargs)
 
-def list_all(query: Optional[FilterQuery]=None, session: Optional[Session]=None, **kwargs) -> Paginator:
+def list_all(query: Optional[FilterQuery]=None, session: Optional[HttpClient]=None, **kwargs) -> Paginator:
     """
     List projects.
 
@@ -322,12 +532,16 @@ def list_all(query: Optional[FilterQuery]=None, session: Optional[Session]=None,
     """
     return Paginator("/project", query=query, session=session, **kwargs)
 
-def retrieve(project_id: str, session: Optional[Session]=None, **kwargs) -> ProjectResponse:
+def retrieve(project_id: str | ProjectRef, session: Optional[HttpClient]=None, **kwargs) -> ProjectResponse:
     """
     Retrieve a project by ID.
 
+    The project is cached for `RETRIEVE_CACHE_TTL` seconds, so polling it more often doesn't send more requests.
+    The cache for a project is cleared by `edit()`, `update_status()` and `invalidate_cache()`. The returned
+    `dict` is shared and should not be modified.
+
     Args:
-        project_id: The project ID.
+        project_id: The project ID (or a `ProjectRef`).
         session: The current Requests session. If `None`, use the last session that was created
         by `base.create_session()`.
         kwargs: Additional arguments to be passed to `session.request()`.
@@ -340,9 +554,10 @@ def retrieve(project_id: str, session: Optional[Session]=None, **kwargs) -> Proj
             400 - Bad Request.
             401 - Invalid API or unauthorized resource access.
     """
-    return base.get(f"/project/{project_id}", session=session, **kwargs)
+    path = project_id.path if isinstance(project_id, ProjectRef) else f"/project/{project_id}"
+    return base.cached_get(path, RETRIEVE_CACHE_TTL, session=session, **kwargs)
 
-def edit(project_id: str, project_data: ProjectData, session: Optional[Session]=None, idempotency_token: Optional[str]=None, **kwargs) -> ProjectResponse:
+def edit(project_id: str | ProjectRef, project_data: ProjectData, session: Optional[HttpClient]=None, idempotency_token: Optional[str]=None, **kwargs) -> ProjectResponse:
     """
     Edit a project.
 
@@ -356,7 +571,7 @@ def edit(project_id: str, project_data: ProjectData, session: Optional[Session]=
     * `instructions`
 
     Args:
-        project_id: The project ID.
+        project_id: The project ID (or a `ProjectRef`).
         project_data: The new data with which to update the project.
         session: The current Requests session. If `None`, use the last session that was created
         by `base.create_session()`.
@@ -367,13 +582,18 @@ def edit(project_id: str, project_data: ProjectData, session: Optional[Session]=
         The updated project.
     
     Raises:
+        ValueError: A field has a value that isn't valid for its enum (e.g. `deviceRequirements`).
+        TypeError: A `str`, `int`, `float` or `bool` field has a value of another type.
         ApiError:
             400 - Bad Request.
             401 - Invalid API or unauthorized resource access.
     """
-    return base.post(f"/project/{project_id}", json=project_data, idempotency_token=idempotency_token, session=session, **kwargs)
+    path = project_id.path if isinstance(project_id, ProjectRef) else f"/project/{project_id}"
+    response = base.post(path, json=_check_project_data(project_data), idempotency_token=idempotency_token, session=session, **kwargs)
+    invalidate_cache(project_id)
+    return response
 
-def update_status(project_id: str, status: ProjectStatus, session: Optional[Session]=None, idempotency_token: Optional[str]=None, **kwargs) -> None:
+def update_status(project_id: str | ProjectRef, status: ProjectStatus, session: Optional[HttpClient]=None, idempotency_token: Optional[str]=None, **kwargs) -> None:
     """
     Update the status of your project.
 
@@ -389,7 +609,7 @@ def update_status(project_id: str, status: ProjectStatus, session: Optional[Sess
     `Archived`
 
     Args:
-        project_id: The project ID.
+        project_id: The project ID (or a `ProjectRef`).
         status: The new status of the Project.
         session: The current Requests session. If `None`, use the last session that was created
         by `base.create_session()`.
@@ -401,19 +621,34 @@ def update_status(project_id: str, status: ProjectStatus, session: Optional[Sess
             400 - Bad Request.
             401 - Invalid API or unauthorized resource access.
     """
-    base.post(f"/project/{project_id}/update-status",
-                 json={ 'status': status },
-                 json_response=False,
-                 idempotency_token=idempotency_token,
-                 session=session,
-                 **kwargs)
-
-def retrieve_statistics(project_id: str, session: Optional[Session]=None, **kwargs) -> ProjectStatistics:
+    path = project_id.status_path if isinstance(project_id, ProjectRef) else f"/project/{project_id}/update-status"
+    payload = _STATUS_PAYLOADS.get(status)
+
+    if payload is None:
+        # Let the API report statuses that this module doesn't know about.
+        base.post(path, json={ 'status': status }, discard_response=True, idempotency_token=idempotency_token, session=session, **kwargs)
+    else:
+        headers = kwargs.pop('headers', None)
+        base.post(path,
+                  data=payload,
+                  headers={ **_JSON_HEADERS, **headers } if headers else _JSON_HEADERS,
+                  discard_response=True,
+                  idempotency_token=idempotency_token,
+                  session=session,
+                  **kwargs)
+    invalidate_cache(project_id)
+
+def retrieve_statistics(project_id: str | ProjectRef, session: Optional[HttpClient]=None, **kwargs) -> ProjectStatistics:
     """
     Retrieve a project by ID.
 
+    The statistics are cached for `STATISTICS_CACHE_TTL` seconds, so polling them more often doesn't send more
+    requests. If the API fails with a transient error (e.g. a 5xx response), statistics cached within the last
+    `STATISTICS_STALE_TTL` seconds are returned instead. The cache for a project is cleared by `edit()`,
+    `update_status()` and `invalidate_cache()`. The returned `dict` is shared and should not be modified.
+
     Args:
-        project_id: The project ID.
+        project_id: The project ID (or a `ProjectRef`).
         session: The current Requests session. If `None`, use the last session that was created
         by `base.create_session()`.
         kwargs: Additional arguments to be passed to `session.request()`.
@@ -426,4 +661,177 @@ def retrieve_statistics(project_id: str, session: Optional[Session]=None, **kwar
             400 - Bad Request.
             401 - Invalid API or unauthorized resource access.
     """
-    return base.get(f"/project/{project_id}/statistics", session=session, **kwargs)
+    path = project_id.statistics_path if isinstance(project_id, ProjectRef) else f"/project/{project_id}/statistics"
+    return base.cached_get(path, STATISTICS_CACHE_TTL, session=session, stale_ttl=STATISTICS_STALE_TTL, **kwargs)
+
+def invalidate_cache(project_id: Optional[str | ProjectRef] = None):
+    """
+    Remove cached responses of `retrieve()` and `retrieve_statistics()`.
+
+    Args:
+        project_id: The project (ID or `ProjectRef`) whose cached responses should be removed. If `None`, remove them for all projects.
+    """
+    if project_id is None:
+        base.invalidate_cache("/project")
+    else:
+        base.invalidate_cache(project_id.path if isinstance(project_id, ProjectRef) else f"/project/{project_id}")
+
+class AsyncPaginator:
+    '''
+    The asynchronous counterpart of `Paginator`, iterated with `async for`.
+
+    Each page is requested with `base.request_async()`, so paginating several filters concurrently
+    (e.g. with `asyncio.gather()`) doesn't need a thread per consumer.
+
+    Attributes:
+        session: The `httpx.AsyncClient`. If `None`, then the most recent client created by `create_async_session()` is used.
+        path: The endpoint path (not including the base url).
+        query: An optional url query. It may be a query string or a `dict` of key value pairs.
+        as_record: If `True`, projects are returned as `ProjectResponseRecord`s instead of `dict`s.
+        kwargs: Additional arguments to pass to the underlying `request_async()` function.
+    '''
+    def __init__(self, path: str, query: Optional[str | FilterQuery] = None, session: Any = None,
+                 as_record: bool = False, **kwargs):
+        self.path = path
+        self.query = query
+        self.session = session
+        self.as_record = as_record
+        self.kwargs = kwargs
+
+    _base_query = Paginator._base_query
+
+    async def __aiter__(self) -> AsyncIterator[ProjectResponseData | ProjectResponseRecord]:
+        async for page in self.iter_pages():
+            for project in page:
+                yield project
+
+    async def iter_pages(self) -> AsyncIterator[Sequence[ProjectResponseData] | list[ProjectResponseRecord]]:
+        '''
+        Iterate through the results a page at a time.
+
+        Returns:
+            An async iterator over the lists of projects in each page. Unless `as_record` is set, a page without any projects is an empty `tuple`.
+        '''
+
+        base_query = self._base_query()
+        path = self.path
+        session = self.session
+        kwargs = self.kwargs
+        from_dict = ProjectResponseRecord.from_dict if self.as_record else None
+        token = None
+
+        while True:
+            page = await base.request_async('GET', path, query=_page_query(base_query, token), session=session, **kwargs)
+            projects = page.get('projects') or _EMPTY
+            yield [from_dict(x) for x in projects] if from_dict is not None else projects
+
+            if (token := page.get('nextToken')) is None:
+                break
+
+def list_all_async(query: Optional[FilterQuery]=None, session: Any=None, **kwargs) -> AsyncPaginator:
+    """
+    The asynchronous counterpart of `list_all()`.
+
+    Args:
+        query: Optional query filter.
+        session: The `httpx.AsyncClient`. If `None`, use the last client that was created
+        by `base.create_async_session()`.
+        kwargs: Additional arguments to be passed to `AsyncPaginator`.
+
+    Returns:
+        An `AsyncPaginator` of projects.
+    """
+    return AsyncPaginator("/project", query=query, session=session, **kwargs)
+
+async def retrieve_async(project_id: str | ProjectRef, session: Any=None, **kwargs) -> ProjectResponse:
+    """
+    The asynchronous counterpart of `retrieve()`. The response is not cached.
+
+    Args:
+        project_id: The project ID (or a `ProjectRef`).
+        session: The `httpx.AsyncClient`. If `None`, use the last client that was created
+        by `base.create_async_session()`.
+        kwargs: Additional arguments to be passed to `session.request()`.
+
+    Returns:
+        The project information.
+
+    Raises:
+        ApiError:
+            400 - Bad Request.
+            401 - Invalid API or unauthorized resource access.
+    """
+    path = project_id.path if isinstance(project_id, ProjectRef) else f"/project/{project_id}"
+    return await base.request_async('GET', path, session=session, **kwargs)
+
+async def retrieve_statistics_async(project_id: str | ProjectRef, session: Any=None, **kwargs) -> ProjectStatistics:
+    """
+    The asynchronous counterpart of `retrieve_statistics()`. The response is not cached.
+
+    Args:
+        project_id: The project ID (or a `ProjectRef`).
+        session: The `httpx.AsyncClient`. If `None`, use the last client that was created
+        by `base.create_async_session()`.
+        kwargs: Additional arguments to be passed to `session.request()`.
+
+    Returns:
+        The project statistics.
+
+    Raises:
+        ApiError:
+            400 - Bad Request.
+            401 - Invalid API or unauthorized resource access.
+    """
+    path = project_id.statistics_path if isinstance(project_id, ProjectRef) else f"/project/{project_id}/statistics"
+    return await base.request_async('GET', path, session=session, **kwargs)
+
+async def create_async(project_data: ProjectData, session: Any=None, idempotency_token: Optional[str]=None, **kwargs) -> ProjectResponse:
+    """
+    The asynchronous counterpart of `create()`.
+
+    Args:
+        project_data: The project data used to create the project.
+        session: The `httpx.AsyncClient`. If `None`, use the last client that was created
+        by `base.create_async_session()`.
+        idempotency_token: A string used to identify this particular request to prevent duplicates.
+        kwargs: Additional arguments to be passed to `session.request()`.
+
+    Returns:
+        The newly created project.
+
+    Raises:
+        ValueError: A required field is missing, or a field has a value that isn't valid for its enum (e.g. `deviceRequirements`).
+        TypeError: A `str`, `int`, `float` or `bool` field has a value of another type.
+        ApiError:
+            400 - Bad Request.
+            401 - Invalid API or unauthorized resource access.
+    """
+    return await base.request_async('POST', "/project", json=_check_new_project_data(project_data), idempotency_token=idempotency_token, session=session, **kwargs)
+
+async def edit_async(project_id: str | ProjectRef, project_data: ProjectData, session: Any=None, idempotency_token: Optional[str]=None, **kwargs) -> ProjectResponse:
+    """
+    The asynchronous counterpart of `edit()`. The project's cached responses of `retrieve()` and
+    `retrieve_statistics()` are cleared.
+
+    Args:
+        project_id: The project ID (or a `ProjectRef`).
+        project_data: The new data with which to update the project.
+        session: The `httpx.AsyncClient`. If `None`, use the last client that was created
+        by `base.create_async_session()`.
+        idempotency_token: A string used to identify this particular request to prevent duplicates.
+        kwargs: Additional arguments to be passed to `session.request()`.
+
+    Returns:
+        The updated project.
+
+    Raises:
+        ValueError: A field has a value that isn't valid for its enum (e.g. `deviceRequirements`).
+        TypeError: A `str`, `int`, `float` or `bool` field has a value of another type.
+        ApiError:
+            400 - Bad Request.
+            401 - Invalid API or unauthorized resource access.
+    """
+    path = project_id.path if isinstance(project_id, ProjectRef) else f"/project/{project_id}"
+    response = await base.request_async('POST', path, json=_check_project_data(project_data), idempotency_token=idempotency_token, session=session, **kwargs)
+    invalidate_cache(project_id)
+    return response